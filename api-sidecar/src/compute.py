@@ -3,6 +3,8 @@ Compute Engine - Symbolic and numeric computation using SymPy
 """
 
 import logging
+import warnings
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple, Union
 import sympy as sp
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application, convert_xor
@@ -18,8 +20,325 @@ try:
 except ImportError:
     from parsing import parse_equation
 
+# Optional accelerator for the residuals handed to SciPy's root finders
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Optional C++ symbolic core for the substitution hot path
+try:
+    import symengine as se
+except ImportError:
+    se = None
+
+USE_SYMENGINE = se is not None
+
 logger = logging.getLogger(__name__)
 
+# Bounds for the parse caches; equation templates are re-sent with new values
+LATEX_CACHE_SIZE = 4096
+PARSE_CACHE_SIZE = 4096
+NUMERIC_FUNCTION_CACHE_SIZE = 512
+ROOT_FUNCTION_CACHE_SIZE = 512
+
+# solve_numeric requests of one expression before its root-finder callable is
+# compiled with Numba; each solve makes only a few dozen scalar calls, so the
+# ~0.1 s compile needs many repeats to pay off
+NUMBA_JIT_MIN_REQUESTS = 100
+
+# Grid size from which numeric_function compiles a fused Numba ufunc; below
+# it the one-off compile costs more than the NumPy temporaries it saves
+NUMBA_VECTORIZE_MIN_POINTS = 1000
+
+# Residual below which a multi-start Newton candidate counts as a root
+NEWTON_ROOT_TOL = 1e-8
+
+# Residual at or below which solve() accepts a candidate without the exact
+# SymPy check; larger float residuals are confirmed exactly before rejecting
+VERIFY_RESIDUAL_TOL = 1e-10
+
+
+# LaTeX sanitizer patterns. The brace rewrites run in order because each
+# relies on inner braces already being normalised (e.g. \frac{x^{2}}{y}).
+_RE_SUP = re.compile(r'\^{([^}]*)}')
+_RE_SUB = re.compile(r'_{([^}]*)}')
+_RE_FUNC_BRACE = re.compile(r'(sqrt|sin|cos|tan|asin|acos|atan|atan2|log|ln|exp|abs)\{([^}]*)\}')
+_RE_FRAC = re.compile(r'\\frac\{([^}]+)\}\{([^}]+)\}')
+
+# Token-level cleanup in a single scan. Alternatives are tried left to right,
+# so operators and decorators win over the generic \command fallback.
+_RE_LATEX_TOKENS = re.compile(
+    r'(?P<op>\\cdot|\\times)'           # \cdot, \times → *
+    r'|(?P<decor>\\left|\\right)'       # sizing decorators
+    r'|(?P<struct>\\(?:sum|prod|int)\b)'  # not solvable without bounds
+    r'|(?P<cmd>\\[a-zA-Z]+)'             # any remaining \command
+    r'|(?P<brace>[{}])'                  # stray braces
+)
+
+# Identifier tokens: letters/underscores followed by alphanumerics/underscores
+_RE_IDENT = re.compile(r'[A-Za-z_]\w*')
+
+# Function/constant names that are never variables: not pre-bound as
+# symbols in solve(), not reported by analyze_system's string fallback
+_BUILTIN_FUNCS = frozenset({
+    'sqrt', 'sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'atan2',
+    'sinh', 'cosh', 'tanh',
+    'exp', 'log', 'ln', 'abs', 'pi', 'Abs', 'sign', 'ceiling',
+    'floor', 'Min', 'Max', 'Piecewise', 'factorial',
+})
+
+
+# Single letters SymPy's parser resolves to objects rather than symbols
+_SYMPY_SINGLE_LETTER_NAMES = frozenset({'N', 'O', 'Q', 'S'})
+
+
+def _symengine_symbol_names(parts: Tuple[str, ...], bound: frozenset) -> Optional[frozenset]:
+    """
+    Free-symbol names of expression strings, parsed by SymEngine's C++ parser.
+
+    SymEngine has no symbol splitting, so the result is only returned when
+    SymPy's parser would read the same names: every name must be bound, a
+    plain single letter, or contain an underscore. Otherwise returns None
+    and the caller parses with SymPy.
+
+    SymEngine reads `a(b+1)` as an undefined function `a` applied to `b+1`,
+    dropping `a` from the free symbols where SymPy sees implicit
+    multiplication, so any undefined-function application also returns None.
+    """
+    try:
+        names = set()
+        for part in parts:
+            expr = se.sympify(_clean_latex(part))
+            if expr.atoms(se.FunctionSymbol):
+                return None
+            names.update(str(s) for s in expr.free_symbols)
+    except Exception:
+        return None
+    for name in names:
+        if name in bound:
+            continue
+        if '_' in name or (len(name) == 1 and name not in _SYMPY_SINGLE_LETTER_NAMES):
+            continue
+        return None
+    return frozenset(names)
+
+
+class _RootFunction:
+    """
+    Scalar callable for one expression, shared across solve_numeric calls.
+
+    Starts as the NumPy lambdify. A root-finder only evaluates it a few dozen
+    times per solve, so the Numba njit compile is only worth it once the same
+    expression has been requested NUMBA_JIT_MIN_REQUESTS times; after that the
+    compiled function is handed out instead.
+    """
+
+    def __init__(self, args: Any, expr: Any):
+        self._args = args
+        self._expr = expr
+        self._numpy_fn = lambdify(args, expr, modules=['numpy'], cse=True)
+        self._jitted = None
+        self._jit_failed = numba is None
+        self._requests = 0
+
+    def get(self, warmup: Tuple[float, ...]):
+        if self._jitted is not None:
+            return self._jitted
+        self._requests += 1
+        if not self._jit_failed and self._requests >= NUMBA_JIT_MIN_REQUESTS:
+            try:
+                jitted = numba.njit(lambdify(self._args, self._expr, modules=['math'], cse=True))
+                jitted(*warmup)
+                self._jitted = jitted
+                return jitted
+            except Exception as e:
+                logger.debug("Numba compilation unavailable for %s: %s", self._expr, e)
+                self._jit_failed = True
+        return self._numpy_fn
+
+
+@lru_cache(maxsize=ROOT_FUNCTION_CACHE_SIZE)
+def _root_function(args: Any, expr: Any) -> _RootFunction:
+    return _RootFunction(args, expr)
+
+
+def _lambdify_numeric(args: Any, expr: Any, warmup: Tuple[float, ...]):
+    """
+    Numeric callable for repeated root-finder evaluation.
+
+    Memoized per (args, expression), so re-solving the same equation skips
+    lambdify; with Numba installed, expressions solved often enough are
+    compiled with njit (`warmup` triggers the compile so unsupported
+    expressions fall back here rather than inside the solver). Common
+    subexpressions are hoisted into temporaries (cse=True) so chained physics
+    formulae evaluate each shared term once per solver iteration.
+    Callers must pass scalars, not arrays.
+    """
+    if isinstance(args, list):
+        args = tuple(args)
+    return _root_function(args, expr).get(warmup)
+
+
+class _NumericFunction:
+    """
+    Array-valued expression callable, as returned by numeric_function.
+
+    Evaluates through the NumPy lambdify; once called with a grid of at least
+    NUMBA_VECTORIZE_MIN_POINTS points (and Numba installed) it compiles a
+    float64 ufunc that evaluates the whole expression in one loop without
+    per-operation temporaries, and uses that from then on.
+    """
+
+    def __init__(self, args: List[Symbol], expr: sp.Expr):
+        self._args = args
+        self._expr = expr
+        self._numpy_fn = lambdify(args, expr, modules=['numpy'], cse=True)
+        self._ufunc = None
+        self._jit_failed = numba is None
+
+    def __call__(self, *values):
+        if self._ufunc is None and not self._jit_failed and np.size(values[0]) >= NUMBA_VECTORIZE_MIN_POINTS:
+            try:
+                signature = 'float64({})'.format(', '.join(['float64'] * len(self._args)))
+                kernel = lambdify(self._args, self._expr, modules=['math'], cse=True)
+                self._ufunc = numba.vectorize([signature])(kernel)
+            except Exception as e:
+                logger.debug("Numba vectorize unavailable for %s: %s", self._expr, e)
+                self._jit_failed = True
+        if self._ufunc is not None:
+            return self._ufunc(*(np.asarray(v, dtype=float) for v in values))
+        return self._numpy_fn(*values)
+
+
+def _newton_multistart(sym: Symbol, expr: sp.Expr, df_expr: sp.Expr, initial_guess: float) -> float:
+    """
+    Run Newton-Raphson from several starting points in one vectorized call.
+
+    Starts from the guess, a decade either side of it, its negation and 1.0,
+    and returns the converged root nearest the guess. Raises if no start
+    converges to a root.
+    """
+    f_np = lambdify(sym, expr, modules=['numpy'], cse=True)
+    df_np = lambdify(sym, df_expr, modules=['numpy'], cse=True)
+
+    # Constant expressions lambdify to scalars; SciPy needs one value per start
+    def f(v):
+        return np.broadcast_to(f_np(v), np.shape(v))
+
+    def df(v):
+        return np.broadcast_to(df_np(v), np.shape(v))
+
+    guess = float(initial_guess)
+    x0 = np.unique(np.array([guess, guess * 0.1, guess * 10, -guess, 1.0]))
+    with warnings.catch_warnings(), np.errstate(all='ignore'):
+        # Per-start failures are expected; they are filtered below
+        warnings.simplefilter('ignore', RuntimeWarning)
+        roots, converged, _zero_der = newton(f, x0, fprime=df, full_output=True)
+        residuals = np.abs(f(roots))
+
+    ok = converged & np.isfinite(roots) & (residuals < NEWTON_ROOT_TOL)
+    if not ok.any():
+        raise ValueError("Newton did not converge to a root from any starting point")
+    candidates = roots[ok]
+    return float(candidates[np.argmin(np.abs(candidates - guess))])
+
+
+def _solve_polynomial(eq: Eq, sym: Symbol) -> Optional[List[sp.Expr]]:
+    """
+    Closed-form roots of a linear or quadratic equation in `sym`.
+
+    Returns None when the equation is not a polynomial of degree 1 or 2 in
+    `sym`, so the caller can fall back to sp_solve. Like sp_solve on a real
+    symbol, quadratic roots that are provably non-real are dropped.
+    """
+    # Eq can collapse to a Boolean (e.g. x**2 = -4 for real x)
+    if not isinstance(eq, Eq):
+        return None
+    try:
+        poly = sp.Poly(eq.lhs - eq.rhs, sym)
+    except sp.PolynomialError:
+        return None
+
+    degree = poly.degree()
+    if degree == 1:
+        a, b = poly.all_coeffs()
+        return [-b / a]
+    if degree != 2:
+        return None
+
+    a, b, c = poly.all_coeffs()
+    if b == 0:
+        root = sp.sqrt(-c / a)
+        roots = [-root, root]
+    else:
+        disc = sp.sqrt(b**2 - 4 * a * c)
+        roots = [(-b - disc) / (2 * a), (-b + disc) / (2 * a)]
+
+    if all(r.is_number for r in roots):
+        roots = sorted(r for r in roots if r.is_real is not False)
+    else:
+        roots = [r for r in roots if r.is_real is not False]
+    return list(dict.fromkeys(roots))
+
+
+def _to_float(expr: Any) -> Optional[float]:
+    """
+    Numeric value of a result, or None if it doesn't reduce to a real number.
+
+    Python and SymPy numbers convert directly; anything else gets a single
+    evalf(15). Conversion errors propagate so callers can log them.
+    """
+    if isinstance(expr, (int, float)):
+        return float(expr)
+    if expr.is_Number:
+        return float(expr)
+    evaluated = expr.evalf(15)
+    return float(evaluated) if evaluated.is_Number else None
+
+
+def _skip_latex(expr: Any) -> None:
+    """Stand-in for sympy.latex when the caller opted out of LaTeX output."""
+    return None
+
+
+# Functions whose identities (sin²+cos² = 1, exp(log(x)), ...) need full simplify
+_TRANSCENDENTAL = (sp.sin, sp.cos, sp.tan, sp.exp, sp.log)
+
+
+def _cheap_simplify(expr: Any) -> Any:
+    """
+    Simplify for presentation without always paying for sp_simplify.
+
+    Atoms are returned as-is and rational functions go through cancel/together,
+    keeping whichever form is shorter (the same measure simplify uses).
+    Anything transcendental or otherwise non-rational, and non-Expr objects
+    such as relationals, get full sp_simplify.
+    """
+    if not isinstance(expr, sp.Basic) or expr.is_Atom:
+        return expr
+    if isinstance(expr, sp.Expr) and not expr.has(*_TRANSCENDENTAL) and expr.is_rational_function():
+        candidate = sp.together(sp.cancel(expr))
+        return candidate if sp.count_ops(candidate) <= sp.count_ops(expr) else expr
+    return sp_simplify(expr)
+
+
+def _replace_latex_token(match: re.Match) -> str:
+    return '*' if match.lastgroup == 'op' else ''
+
+
+@lru_cache(maxsize=LATEX_CACHE_SIZE)
+def _clean_latex(expr_str: str) -> str:
+    """Strip LaTeX formatting so the string can be handed to parse_expr."""
+    expr_str = _RE_SUP.sub(r'^\1', expr_str)   # ^{2} → ^2
+    expr_str = _RE_SUB.sub(r'_\1', expr_str)   # _{x} → _x
+    # Convert LaTeX function braces to parens: sqrt{...} → sqrt(...)
+    expr_str = _RE_FUNC_BRACE.sub(r'\1(\2)', expr_str)
+    # Strip \frac{a}{b} → (a)/(b)
+    expr_str = _RE_FRAC.sub(r'(\1)/(\2)', expr_str)
+    # Operators, decorators, remaining commands and braces in one pass
+    return _RE_LATEX_TOKENS.sub(_replace_latex_token, expr_str)
+
 
 class ComputeEngine:
     """
@@ -28,12 +347,33 @@ class ComputeEngine:
     This engine handles all computation - the LLM proposes, this validates and computes.
     """
 
-    def __init__(self):
+    # Symbols are immutable and identical for every engine, so the cache is
+    # shared. dict.setdefault is atomic under the GIL, so racing misses agree.
+    _symbol_cache: Dict[str, Symbol] = {}
+
+    def __init__(self, resolve_constants: bool = False):
+        # Replace unbound constant names (c, h, g, ...) with their values
+        self.resolve_constants = resolve_constants
+
         # Standard transformations for parsing
         self.transformations = standard_transformations + (implicit_multiplication_application, convert_xor)
 
-        # Cache for parsed symbols
-        self._symbol_cache: Dict[str, Symbol] = {}
+        # Common names bound to the cached symbols on every parse
+        self._common_symbols_dict: Dict[str, Symbol] = {
+            s: self._get_symbol(s)
+            for s in ('x', 'y', 'z', 't', 'a', 'b', 'c', 'n', 'm', 'r', 'theta', 'phi')
+        }
+
+        # Memoized parse_expr keyed on the bindings (see _parse_expression)
+        self._parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._parse_with_bindings)
+
+        # Free-symbol names per equation for analyze_system
+        self._equation_symbols_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._equation_symbol_names)
+
+        # Compiled NumPy functions for plotting (see numeric_function)
+        self._numeric_function_cached = lru_cache(maxsize=NUMERIC_FUNCTION_CACHE_SIZE)(
+            self._compile_numeric_function
+        )
 
         # Physical constants (value, unit)
         self.constants: Dict[str, Tuple[float, str]] = {
@@ -52,60 +392,149 @@ class ComputeEngine:
             "atm": (101325, "Pa"),  # Standard atmosphere
             "sigma": (5.670374419e-8, "W/(m^2*K^4)"),  # Stefan-Boltzmann constant
         }
+        # Keyed by name: names outside local_dict parse to plain Symbols
+        self._constants_subs: Dict[str, sp.Float] = {
+            name: sp.Float(value) for name, (value, _unit) in self.constants.items()
+        }
 
     def _get_symbol(self, name: str) -> Symbol:
         """Get or create a symbol."""
-        if name not in self._symbol_cache:
-            self._symbol_cache[name] = Symbol(name, real=True)
-        return self._symbol_cache[name]
+        sym = self._symbol_cache.get(name)
+        if sym is None:
+            sym = self._symbol_cache.setdefault(name, Symbol(name, real=True))
+        return sym
 
     def _parse_expression(self, expr_str: str, local_dict: Optional[Dict] = None) -> sp.Expr:
-        """Parse a string expression into a SymPy expression."""
-        if local_dict is None:
-            local_dict = {}
+        """
+        Parse a string expression into a SymPy expression.
+
+        With resolve_constants enabled, constant names the caller did not bind
+        in local_dict are replaced by their numeric values.
+        """
+        caller_names = set(local_dict) if local_dict else set()
 
         # Strip LaTeX formatting before parsing
-        expr_str = re.sub(r'\^{([^}]*)}', r'^\1', expr_str)   # ^{2} → ^2
-        expr_str = re.sub(r'_{([^}]*)}', r'_\1', expr_str)    # _{x} → _x
-        # Convert LaTeX function braces to parens: sqrt{...} → sqrt(...)
-        expr_str = re.sub(r'(sqrt|sin|cos|tan|asin|acos|atan|atan2|log|ln|exp|abs)\{([^}]*)\}',
-                          r'\1(\2)', expr_str)
-        # Strip \frac{a}{b} → (a)/(b)
-        expr_str = re.sub(r'\\frac\{([^}]+)\}\{([^}]+)\}', r'(\1)/(\2)', expr_str)
-        # Strip LaTeX operators: \cdot → *, \times → *
-        expr_str = expr_str.replace('\\cdot', '*').replace('\\times', '*')
-        # Strip \left, \right decorators
-        expr_str = re.sub(r'\\left|\\right', '', expr_str)
-        # Strip structural operators: \sum, \prod, \int (not solvable without bounds)
-        expr_str = re.sub(r'\\(sum|prod|int)\b', '', expr_str)
-        # Strip remaining \command sequences
-        expr_str = re.sub(r'\\[a-zA-Z]+', '', expr_str)
-        # Clean up stray braces
-        expr_str = expr_str.replace('{', '').replace('}', '')
-
-        # Add common symbols
-        common_symbols = ['x', 'y', 'z', 't', 'a', 'b', 'c', 'n', 'm', 'r', 'theta', 'phi']
-        for s in common_symbols:
-            if s not in local_dict:
-                local_dict[s] = self._get_symbol(s)
-
-        # Parse with transformations
+        expr_str = _clean_latex(expr_str)
+
+        # Add common symbols; caller bindings win
+        local_dict = {**self._common_symbols_dict, **(local_dict or {})}
+
+        # Parse with transformations. Results are immutable, so they are
+        # memoized on the bindings; the value type is part of the key because
+        # 2 == 2.0 would otherwise share a result. Unhashable values skip it.
         try:
-            return parse_expr(expr_str, local_dict=local_dict, transformations=self.transformations)
+            try:
+                bindings = frozenset((name, type(value), value) for name, value in local_dict.items())
+            except TypeError:
+                bindings = None
+            if bindings is not None:
+                expr = self._parse_cached(expr_str, bindings)
+            else:
+                expr = parse_expr(expr_str, local_dict=local_dict, transformations=self.transformations)
         except Exception as e:
             raise ValueError(f"Failed to parse expression '{expr_str}': {e}")
 
-    def evaluate(self, expression: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if self.resolve_constants and isinstance(expr, sp.Basic):
+            constants = {
+                sym: self._constants_subs[sym.name] for sym in expr.free_symbols
+                if sym.name in self._constants_subs and sym.name not in caller_names
+            }
+            if constants:
+                expr = expr.xreplace(constants)
+        return expr
+
+    def _parse_with_bindings(self, expr_str: str, bindings: frozenset) -> sp.Expr:
+        """Parse a cleaned string with (name, type, value) bindings as local_dict."""
+        local_dict = {name: value for name, _type, value in bindings}
+        return parse_expr(expr_str, local_dict=local_dict, transformations=self.transformations)
+
+    def _equation_symbol_names(self, eq_str: str, known_names: Tuple[str, ...]) -> frozenset:
+        """Names of the free symbols in an equation, with known_names bound as symbols."""
+        lhs, rhs = parse_equation(eq_str)
+        if USE_SYMENGINE:
+            names = _symengine_symbol_names((lhs, rhs), frozenset(known_names).union(self._common_symbols_dict))
+            if names is not None:
+                return names
+
+        local_dict = {name: self._get_symbol(name) for name in known_names}
+        eq = Eq(self._parse_expression(lhs, local_dict), self._parse_expression(rhs, local_dict))
+        return frozenset(str(s) for s in eq.free_symbols)
+
+    def _substitute(self, expr: sp.Expr, subs_dict: Dict[Symbol, Any]) -> sp.Expr:
+        """
+        Substitute known values into an expression.
+
+        Uses SymEngine when installed and converts back to SymPy for
+        presentation. SymEngine symbols carry no assumptions, so the cached
+        real symbols are restored by name on the way back.
+        """
+        if USE_SYMENGINE and subs_dict:
+            try:
+                se_subs = {se.Symbol(str(k)): v for k, v in subs_dict.items()}
+                result = sp.sympify(se.sympify(expr).subs(se_subs))
+                return result.xreplace({s: self._get_symbol(s.name) for s in result.free_symbols})
+            except Exception as e:
+                logger.debug("SymEngine substitution failed for %s: %s", expr, e)
+        # Keys are the cached Symbols, so a structural replace is enough
+        return expr.xreplace(subs_dict)
+
+    def clear_caches(self) -> None:
+        """Drop memoized equation splits, LaTeX cleanup, parse results and compiled functions."""
+        _clean_latex.cache_clear()
+        parse_equation.cache_clear()
+        self._parse_cached.cache_clear()
+        self._equation_symbols_cached.cache_clear()
+        self._numeric_function_cached.cache_clear()
+        _root_function.cache_clear()
+
+    def numeric_function(
+        self,
+        expression: str,
+        variable: str,
+        parameters: Tuple[str, ...] = (),
+    ):
+        """
+        Compile an expression into a NumPy function of (variable, *parameters).
+
+        The returned callable accepts arrays, so a whole grid of points is
+        evaluated in one call. Compiled functions are cached per
+        (expression, variable, parameters).
+
+        Raises:
+            ValueError: If the expression can't be parsed or uses names
+                other than the variable and parameters.
+        """
+        return self._numeric_function_cached(expression, variable, tuple(parameters))
+
+    def _compile_numeric_function(self, expression: str, variable: str, parameters: Tuple[str, ...]):
+        names = (variable,) + parameters
+        local_dict = {name: self._get_symbol(name) for name in names}
+        expr = self._parse_expression(expression, local_dict)
+
+        args = [local_dict[name] for name in names]
+        unbound = sp.sympify(expr).free_symbols - set(args)
+        if unbound:
+            raise ValueError(f"Undefined variables: {', '.join(sorted(str(s) for s in unbound))}")
+        return _NumericFunction(args, expr)
+
+    def evaluate(
+        self,
+        expression: str,
+        variables: Optional[Dict[str, Any]] = None,
+        include_latex: bool = True,
+    ) -> Dict[str, Any]:
         """
         Evaluate a mathematical expression.
 
         Args:
             expression: Mathematical expression string
             variables: Optional dict of variable values
+            include_latex: Render LaTeX output (None when False)
 
         Returns:
             Dict with symbolic_result, numeric_result, latex
         """
+        render_latex = latex if include_latex else _skip_latex
         try:
             # Build local dict with variable values
             local_dict = {}
@@ -121,14 +550,12 @@ class ComputeEngine:
             expr = self._parse_expression(expression, local_dict)
 
             # Simplify
-            simplified = sp_simplify(expr)
+            simplified = _cheap_simplify(expr)
 
             # Try numeric evaluation
             numeric_result = None
             try:
-                evaluated = N(simplified)
-                if evaluated.is_number:
-                    numeric_result = float(evaluated)
+                numeric_result = _to_float(simplified)
             except (TypeError, ValueError, AttributeError, OverflowError) as e:
                 logger.debug("Numeric evaluation failed for '%s': %s", expression, e)
 
@@ -136,7 +563,7 @@ class ComputeEngine:
                 "success": True,
                 "symbolic_result": str(simplified),
                 "numeric_result": numeric_result,
-                "latex": latex(simplified),
+                "latex": render_latex(simplified),
             }
         except Exception as e:
             logger.error("evaluate failed for '%s': %s", expression, e)
@@ -147,7 +574,9 @@ class ComputeEngine:
         equations: List[str],
         target: str,
         method: Optional[str] = None,
-        variables: Optional[Dict[str, Any]] = None
+        variables: Optional[Dict[str, Any]] = None,
+        include_latex: bool = True,
+        with_analysis: bool = False,
     ) -> Dict[str, Any]:
         """
         Solve equations for a target variable.
@@ -157,10 +586,14 @@ class ComputeEngine:
             target: Variable to solve for
             method: "symbolic", "numeric", or "auto"
             variables: Optional dict of known variable values (e.g., {"m": {"value": 12, "unit": "kg"}})
+            include_latex: Render LaTeX for solutions and steps (None when False)
+            with_analysis: Also return the analyze_system report as
+                "system_analysis", derived from the equations parsed here
 
         Returns:
             Dict with solutions, method_used, steps
         """
+        render_latex = latex if include_latex else _skip_latex
         try:
             target_sym = self._get_symbol(target)
             parsed_eqs = []
@@ -174,19 +607,19 @@ class ComputeEngine:
             # identifiers found in equation strings. Without this, implicit
             # multiplication splits "Fx" into "F*x" and "conv_lbf_to_N" into
             # separate tokens, breaking multi-step equation chains.
-            _BUILTIN_FUNCS = {
-                'sqrt', 'sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'atan2',
-                'exp', 'log', 'ln', 'abs', 'pi', 'Abs', 'sign', 'ceiling',
-                'floor', 'Min', 'Max', 'Piecewise', 'factorial',
-            }
+            tokens = set()
             for eq_str in equations:
-                # Match identifiers: letters/underscores followed by alphanumeric/underscores
-                for token in re.findall(r'[A-Za-z_]\w*', eq_str):
-                    if token not in local_dict and token not in _BUILTIN_FUNCS:
-                        local_dict[token] = self._get_symbol(token)
-
-            # Build substitution dict from known variables
+                tokens.update(_RE_IDENT.findall(eq_str))
+            local_dict.update({
+                token: self._get_symbol(token)
+                for token in tokens - _BUILTIN_FUNCS - local_dict.keys()
+            })
+
+            # Build substitution dict from known variables. Values are
+            # sympified once so xreplace can drop them straight into the tree;
+            # known_values keeps the raw numbers for the step text.
             subs_dict = {}
+            known_values = {}
             if variables:
                 for name, value in variables.items():
                     if name == target:
@@ -196,14 +629,15 @@ class ComputeEngine:
                     local_dict[name] = sym  # Add to local_dict for parsing
                     if isinstance(value, dict):
                         # Value with unit: {"value": 5, "unit": "m"}
-                        subs_dict[sym] = value.get("value", 0)
+                        known_values[sym] = value.get("value", 0)
                     else:
-                        subs_dict[sym] = value
+                        known_values[sym] = value
+                    subs_dict[sym] = sp.sympify(known_values[sym])
 
                 if subs_dict:
                     steps.append({
                         "description": "Known values",
-                        "expression": ", ".join(f"{k} = {v}" for k, v in subs_dict.items()),
+                        "expression": ", ".join(f"{k} = {v}" for k, v in known_values.items()),
                         "latex": None,
                     })
 
@@ -218,13 +652,16 @@ class ComputeEngine:
                 steps.append({
                     "description": f"Parse equation: {eq_str}",
                     "expression": str(eq),
-                    "latex": latex(eq),
+                    "latex": render_latex(eq),
                 })
 
             # Solve symbolically
             unknowns: List[Symbol] = []
             if len(parsed_eqs) == 1:
-                solutions = sp_solve(parsed_eqs[0], target_sym)
+                # Linear/quadratic isolation doesn't need the general solver
+                solutions = _solve_polynomial(parsed_eqs[0], target_sym)
+                if solutions is None:
+                    solutions = sp_solve(parsed_eqs[0], target_sym)
             else:
                 # System of equations: solve for ALL unknowns so SymPy can
                 # chain through intermediate variables (e.g. Fx = Fx_lbf*conv,
@@ -283,20 +720,35 @@ class ComputeEngine:
 
                         # Verify candidates against the OTHER equations.
                         # If substituting makes a fully-evaluable equation
-                        # false, the system is contradictory.
-                        other_eqs = parsed_eqs[:i] + parsed_eqs[i + 1:]
+                        # false, the system is contradictory. Residuals are
+                        # built once per equation; those depending only on
+                        # the target are lambdified so numeric candidates
+                        # that clearly satisfy them skip the SymPy traversal.
+                        # A large float residual may just be rounding at big
+                        # magnitudes, so only the exact check rejects.
+                        checks = []
+                        for other in parsed_eqs[:i] + parsed_eqs[i + 1:]:
+                            if target_sym not in other.free_symbols:
+                                continue
+                            residual = other.lhs - other.rhs
+                            numeric_check = None
+                            if residual.free_symbols == {target_sym}:
+                                numeric_check = lambdify(target_sym, residual, modules=['numpy'])
+                            checks.append((residual, numeric_check))
+
                         verified = []
                         for cand in candidates:
                             contradicted = False
-                            for other in other_eqs:
-                                if target_sym not in other.free_symbols:
-                                    continue
-                                substituted = other.subs(target_sym, cand)
-                                # Eq(1, 2) evaluates to S.false
-                                if substituted is sp.S.false:
-                                    contradicted = True
-                                    break
-                                # Bare expression form: numeric and != 0
+                            for residual, numeric_check in checks:
+                                if numeric_check is not None and cand.is_number:
+                                    try:
+                                        with np.errstate(all='ignore'):
+                                            value = numeric_check(complex(cand))
+                                        if np.isfinite(value) and abs(value) <= VERIFY_RESIDUAL_TOL:
+                                            continue
+                                    except (TypeError, ValueError):
+                                        pass
+                                substituted = residual.xreplace({target_sym: cand})
                                 if substituted.is_number and substituted != 0:
                                     contradicted = True
                                     break
@@ -320,27 +772,24 @@ class ComputeEngine:
             # --- Format solutions ---
             solution_values = []
             for sol in target_solutions:
-                sol_simplified = sp_simplify(sol)
+                sol_simplified = _cheap_simplify(sol)
 
                 symbolic_str = str(sol_simplified)
-                symbolic_latex = latex(sol_simplified)
+                symbolic_latex = render_latex(sol_simplified)
 
                 # Try numeric evaluation with variable substitution
                 numeric = None
                 try:
                     if subs_dict:
-                        sol_substituted = sol_simplified.subs(subs_dict)
+                        sol_substituted = self._substitute(sol_simplified, subs_dict)
                         steps.append({
                             "description": "Substitute known values",
                             "expression": str(sol_substituted),
-                            "latex": latex(sol_substituted),
+                            "latex": render_latex(sol_substituted),
                         })
-                        evaluated = N(sol_substituted)
+                        numeric = _to_float(sol_substituted)
                     else:
-                        evaluated = N(sol_simplified)
-
-                    if evaluated.is_number:
-                        numeric = float(evaluated)
+                        numeric = _to_float(sol_simplified)
                 except (TypeError, ValueError, AttributeError, OverflowError) as e:
                     logger.debug("Numeric conversion failed for solution of '%s': %s", target, e)
 
@@ -364,12 +813,19 @@ class ComputeEngine:
                         "latex": f"{target} = {solution_values[0]['numeric']}",
                     })
 
-            return {
+            result = {
                 "success": True,
                 "solutions": solution_values,
                 "method_used": "symbolic" if not subs_dict else "symbolic+numeric",
                 "steps": steps,
             }
+            if with_analysis:
+                known_set = variables.keys() - {target} if variables else set()
+                all_variables = {str(s) for eq in parsed_eqs for s in eq.free_symbols}
+                result["system_analysis"] = self._system_analysis(
+                    len(equations), all_variables, known_set, len(parsed_eqs)
+                )
+            return result
         except Exception as e:
             logger.error("solve failed for target '%s': %s", target, e)
             return {"success": False, "error": str(e)}
@@ -382,6 +838,7 @@ class ComputeEngine:
         method: str = "auto",
         initial_guess: float = 1.0,
         bounds: Optional[Tuple[float, float]] = None,
+        include_latex: bool = True,
     ) -> Dict[str, Any]:
         """
         Solve equations numerically for transcendental equations.
@@ -393,10 +850,12 @@ class ComputeEngine:
             method: "fsolve" | "brentq" | "newton" | "auto"
             initial_guess: Starting point for numeric solver
             bounds: Tuple (min, max) for bracketed methods like brentq
+            include_latex: Render LaTeX for parsed equations and symbolic solutions
 
         Returns:
             Dict with solutions, method_used, residual
         """
+        render_latex = latex if include_latex else _skip_latex
         try:
             target_sym = self._get_symbol(target)
             steps = []
@@ -404,6 +863,7 @@ class ComputeEngine:
             # Build local_dict with variable symbols
             local_dict = {target: target_sym}
             subs_dict = {}
+            known_values = {}
 
             if variables:
                 for name, value in variables.items():
@@ -412,9 +872,10 @@ class ComputeEngine:
                     sym = self._get_symbol(name)
                     local_dict[name] = sym
                     if isinstance(value, dict):
-                        subs_dict[sym] = value.get("value", 0)
+                        known_values[sym] = value.get("value", 0)
                     else:
-                        subs_dict[sym] = value
+                        known_values[sym] = value
+                    subs_dict[sym] = sp.sympify(known_values[sym])
 
             # Parse equations into expressions (LHS - RHS = 0 form)
             expressions = []
@@ -430,20 +891,20 @@ class ComputeEngine:
                 steps.append({
                     "description": f"Parse equation: {eq_str}",
                     "expression": f"{lhs_expr} - ({rhs_expr}) = 0",
-                    "latex": latex(expr),
+                    "latex": render_latex(expr),
                 })
 
             # Substitute known values
             substituted_exprs = []
             for expr in expressions:
                 if subs_dict:
-                    expr = expr.subs(subs_dict)
+                    expr = self._substitute(expr, subs_dict)
                 substituted_exprs.append(expr)
 
             if subs_dict:
                 steps.append({
                     "description": "Substitute known values",
-                    "expression": str(subs_dict),
+                    "expression": str(known_values),
                     "latex": None,
                 })
 
@@ -461,7 +922,7 @@ class ComputeEngine:
                     }
 
                 # Convert to numeric function
-                f = lambdify(target_sym, expr, modules=['numpy'])
+                f = _lambdify_numeric(target_sym, expr, (float(initial_guess),))
 
                 # Choose method
                 method_used = method
@@ -478,7 +939,7 @@ class ComputeEngine:
                             steps.append({
                                 "description": "Symbolic solution found",
                                 "expression": str(sym_solutions[0]),
-                                "latex": latex(sym_solutions[0]),
+                                "latex": render_latex(sym_solutions[0]),
                             })
                             return {
                                 "success": True,
@@ -486,7 +947,7 @@ class ComputeEngine:
                                     "variable": target,
                                     "symbolic": str(sym_solutions[0]),
                                     "numeric": numeric,
-                                    "latex": latex(sym_solutions[0]),
+                                    "latex": render_latex(sym_solutions[0]),
                                 }],
                                 "method_used": "symbolic",
                                 "residual": float(f(numeric)),
@@ -494,8 +955,8 @@ class ComputeEngine:
                             }
                     except Exception:
                         pass
-                    # Fall back to numeric
-                    method_used = "fsolve"
+                    # Fall back to Newton with the analytical derivative
+                    method_used = "newton"
 
                 steps.append({
                     "description": f"Using numeric method: {method_used}",
@@ -503,11 +964,39 @@ class ComputeEngine:
                     "latex": None,
                 })
 
-                if method_used in ["fsolve", "auto"]:
-                    result = fsolve(f, initial_guess, full_output=True)
+                if method_used == "newton":
+                    try:
+                        # Compute derivative for Newton's method
+                        df_expr = diff(expr, target_sym)
+                        if method == "auto":
+                            # No trusted guess: try several starts in one pass
+                            solution = _newton_multistart(target_sym, expr, df_expr, initial_guess)
+                        else:
+                            df = _lambdify_numeric(target_sym, df_expr, (float(initial_guess),))
+                            solution = float(newton(f, initial_guess, fprime=df))
+                        if not np.isfinite(solution):
+                            raise ValueError(f"non-finite root {solution}")
+                        residual = float(f(solution))
+                    except Exception as e:
+                        if method != "auto":
+                            return {
+                                "success": False,
+                                "error": f"Newton's method failed: {e}"
+                            }
+                        # Auto mode: fsolve is slower but more forgiving
+                        logger.debug("Newton failed for '%s', falling back to fsolve: %s", target, e)
+                        solution = None
+                        method_used = "fsolve"
+                        steps.append({
+                            "description": "Newton's method failed; using numeric method: fsolve",
+                            "expression": str(e),
+                            "latex": None,
+                        })
+
+                if method_used == "fsolve":
+                    result = fsolve(lambda v: f(v[0]), initial_guess, full_output=True)
                     solution = float(result[0][0])
                     residual = float(f(solution))
-                    method_used = "fsolve"
 
                 elif method_used == "brentq":
                     if bounds is None:
@@ -521,19 +1010,6 @@ class ComputeEngine:
                             "error": f"brentq failed: {e}. Ensure bounds bracket a root."
                         }
 
-                elif method_used == "newton":
-                    try:
-                        # Compute derivative for Newton's method
-                        df_expr = diff(expr, target_sym)
-                        df = lambdify(target_sym, df_expr, modules=['numpy'])
-                        solution = newton(f, initial_guess, fprime=df)
-                        residual = float(f(solution))
-                    except Exception as e:
-                        return {
-                            "success": False,
-                            "error": f"Newton's method failed: {e}"
-                        }
-
                 if solution is not None:
                     steps.append({
                         "description": f"Numeric solution",
@@ -567,19 +1043,19 @@ class ComputeEngine:
                     }
 
                 var_list = list(all_vars)
-                fs = [lambdify(var_list, expr, modules=['numpy']) for expr in substituted_exprs]
+                x0 = np.full(len(var_list), initial_guess, dtype=float)
+                # One compiled function returning every residual at once
+                residuals = _lambdify_numeric(var_list, tuple(substituted_exprs), tuple(x0))
 
                 def system(vals):
-                    val_dict = dict(zip(var_list, vals))
-                    return [float(f(*[val_dict[v] for v in var_list])) for f in fs]
+                    return np.asarray(residuals(*vals), dtype=float).ravel()
 
-                x0 = [initial_guess] * len(var_list)
-                result = fsolve(system, x0, full_output=True)
-                solutions_arr = result[0]
+                solutions_arr, infodict, _ier, _msg = fsolve(system, x0, full_output=True)
 
                 target_idx = var_list.index(target_sym)
                 solution = float(solutions_arr[target_idx])
-                residual = float(np.max(np.abs(system(solutions_arr))))
+                # fvec is the system already evaluated at the returned point
+                residual = float(np.max(np.abs(infodict['fvec'])))
 
                 steps.append({
                     "description": f"Numeric solution (system)",
@@ -604,17 +1080,16 @@ class ComputeEngine:
             logger.error("solve_numeric failed for target '%s': %s", target, e)
             return {"success": False, "error": str(e)}
 
-    def simplify(self, expression: str) -> Dict[str, Any]:
+    def simplify(self, expression: str, include_latex: bool = True) -> Dict[str, Any]:
         """Simplify an expression."""
+        render_latex = latex if include_latex else _skip_latex
         try:
             expr = self._parse_expression(expression)
             simplified = sp_simplify(expr)
 
             numeric_result = None
             try:
-                evaluated = N(simplified)
-                if evaluated.is_number:
-                    numeric_result = float(evaluated)
+                numeric_result = _to_float(simplified)
             except (TypeError, ValueError, AttributeError, OverflowError) as e:
                 logger.debug("Numeric evaluation failed in simplify for '%s': %s", expression, e)
 
@@ -622,25 +1097,32 @@ class ComputeEngine:
                 "success": True,
                 "symbolic_result": str(simplified),
                 "numeric_result": numeric_result,
-                "latex": latex(simplified),
+                "latex": render_latex(simplified),
             }
         except Exception as e:
             logger.error("simplify failed for '%s': %s", expression, e)
             return {"success": False, "error": str(e)}
 
-    def differentiate(self, expression: str, variable: str, order: int = 1) -> Dict[str, Any]:
+    def differentiate(
+        self,
+        expression: str,
+        variable: str,
+        order: int = 1,
+        include_latex: bool = True,
+    ) -> Dict[str, Any]:
         """Differentiate an expression."""
+        render_latex = latex if include_latex else _skip_latex
         try:
             expr = self._parse_expression(expression)
             var_sym = self._get_symbol(variable)
 
             result = diff(expr, var_sym, order)
-            simplified = sp_simplify(result)
+            simplified = _cheap_simplify(result)
 
             return {
                 "success": True,
                 "symbolic_result": str(simplified),
-                "latex": latex(simplified),
+                "latex": render_latex(simplified),
             }
         except Exception as e:
             logger.error("differentiate failed for '%s' wrt '%s': %s", expression, variable, e)
@@ -650,9 +1132,11 @@ class ComputeEngine:
         self,
         expression: str,
         variable: str,
-        limits: Optional[Tuple[float, float]] = None
+        limits: Optional[Tuple[float, float]] = None,
+        include_latex: bool = True,
     ) -> Dict[str, Any]:
         """Integrate an expression."""
+        render_latex = latex if include_latex else _skip_latex
         try:
             expr = self._parse_expression(expression)
             var_sym = self._get_symbol(variable)
@@ -662,14 +1146,16 @@ class ComputeEngine:
             else:
                 result = sp_integrate(expr, var_sym)
 
-            simplified = sp_simplify(result)
+            # A definite integral with no parameters left only needs evalf
+            if limits and isinstance(result, sp.Basic) and not result.free_symbols:
+                simplified = result
+            else:
+                simplified = _cheap_simplify(result)
 
             numeric_result = None
             if limits:
                 try:
-                    evaluated = N(simplified)
-                    if evaluated.is_number:
-                        numeric_result = float(evaluated)
+                    numeric_result = _to_float(simplified)
                 except (TypeError, ValueError, AttributeError, OverflowError) as e:
                     logger.debug("Numeric evaluation failed in integrate for '%s': %s", expression, e)
 
@@ -677,7 +1163,7 @@ class ComputeEngine:
                 "success": True,
                 "symbolic_result": str(simplified),
                 "numeric_result": numeric_result,
-                "latex": latex(simplified),
+                "latex": render_latex(simplified),
             }
         except Exception as e:
             logger.error("integrate failed for '%s' over '%s': %s", expression, variable, e)
@@ -722,78 +1208,78 @@ class ComputeEngine:
         try:
             known_set = set(known_variables or [])
             all_variables = set()
-            parsed_eqs = []
+            parsed_count = 0
 
-            # Build local_dict with known variable symbols so subscripted
+            # Known variable names are bound as symbols so subscripted
             # names like F_r, F_x are parsed as single symbols (not F*r).
-            local_dict: Dict[str, Symbol] = {}
-            for name in (known_variables or []):
-                local_dict[name] = self._get_symbol(name)
+            known_names = tuple(sorted(known_set))
 
             # Parse all equations and collect variables
             for eq_str in equations:
-                lhs, rhs = parse_equation(eq_str)
-
                 try:
-                    lhs_expr = self._parse_expression(lhs, local_dict)
-                    rhs_expr = self._parse_expression(rhs, local_dict)
-                    eq = Eq(lhs_expr, rhs_expr)
-                    parsed_eqs.append(eq)
-
-                    # Collect free symbols (variables)
-                    all_variables.update(str(s) for s in eq.free_symbols)
+                    all_variables.update(self._equation_symbols_cached(eq_str, known_names))
+                    parsed_count += 1
                 except Exception:
                     # If parsing fails, try to extract variables from string
-                    import re
-                    vars_in_eq = re.findall(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b', eq_str)
-                    all_variables.update(v for v in vars_in_eq
-                                        if v not in ['sin', 'cos', 'tan', 'exp', 'log', 'sqrt'])
-
-            # Calculate unknowns (variables not in known set)
-            unknowns = all_variables - known_set
-            knowns = all_variables & known_set
-
-            equation_count = len(equations)
-            unknown_count = len(unknowns)
-
-            # Determine system status
-            if equation_count == unknown_count:
-                status = "determined"
-                message = f"System is well-determined: {equation_count} equation(s) for {unknown_count} unknown(s)"
-            elif equation_count < unknown_count:
-                status = "under_determined"
-                missing = unknown_count - equation_count
-                message = f"System is under-determined: {equation_count} equation(s) but {unknown_count} unknown(s). Need {missing} more equation(s) or value(s)."
-            else:
-                status = "over_determined"
-                extra = equation_count - unknown_count
-                message = f"System is over-determined: {equation_count} equation(s) for only {unknown_count} unknown(s). May have {extra} redundant or conflicting equation(s)."
-
-            # Determine which variables can be solved for
-            solvable_for = []
-            if status in ["determined", "over_determined"] and parsed_eqs:
-                # A variable is solvable if we have at least as many equations as unknowns
-                # For now, if determined or over-determined, all unknowns are potentially solvable
-                solvable_for = list(unknowns)
-            elif status == "under_determined" and parsed_eqs and unknowns:
-                # In under-determined systems, we might still solve for some variables
-                # if they appear in equations with enough constraints
-                # For simplicity, list all unknowns but mark system as under-determined
-                solvable_for = list(unknowns)
+                    all_variables.update(v for v in _RE_IDENT.findall(eq_str) if v not in _BUILTIN_FUNCS)
 
-            return {
-                "success": True,
-                "equation_count": equation_count,
-                "variable_count": len(all_variables),
-                "unknown_count": unknown_count,
-                "known_count": len(knowns),
-                "unknowns": sorted(list(unknowns)),
-                "knowns": sorted(list(knowns)),
-                "all_variables": sorted(list(all_variables)),
-                "status": status,
-                "message": message,
-                "solvable_for": sorted(solvable_for),
-            }
+            return self._system_analysis(len(equations), all_variables, known_set, parsed_count)
         except Exception as e:
             logger.error("analyze_system failed: %s", e)
             return {"success": False, "error": str(e)}
+
+    def _system_analysis(
+        self,
+        equation_count: int,
+        all_variables: set,
+        known_set: set,
+        parsed_count: int,
+    ) -> Dict[str, Any]:
+        """Determinacy report for analyze_system and solve(with_analysis=True)."""
+        # Calculate unknowns (variables not in known set). One sort of
+        # all names; the filtered lists inherit its order.
+        all_var_list = sorted(all_variables)
+        unknowns = [v for v in all_var_list if v not in known_set]
+        knowns = [v for v in all_var_list if v in known_set]
+
+        unknown_count = len(unknowns)
+
+        # Determine system status
+        if equation_count == unknown_count:
+            status = "determined"
+            message = f"System is well-determined: {equation_count} equation(s) for {unknown_count} unknown(s)"
+        elif equation_count < unknown_count:
+            status = "under_determined"
+            missing = unknown_count - equation_count
+            message = f"System is under-determined: {equation_count} equation(s) but {unknown_count} unknown(s). Need {missing} more equation(s) or value(s)."
+        else:
+            status = "over_determined"
+            extra = equation_count - unknown_count
+            message = f"System is over-determined: {equation_count} equation(s) for only {unknown_count} unknown(s). May have {extra} redundant or conflicting equation(s)."
+
+        # Determine which variables can be solved for. The list is already
+        # sorted and the response is read-only, so it is shared, not copied.
+        solvable_for = []
+        if status in ["determined", "over_determined"] and parsed_count:
+            # A variable is solvable if we have at least as many equations as unknowns
+            # For now, if determined or over-determined, all unknowns are potentially solvable
+            solvable_for = unknowns
+        elif status == "under_determined" and parsed_count and unknowns:
+            # In under-determined systems, we might still solve for some variables
+            # if they appear in equations with enough constraints
+            # For simplicity, list all unknowns but mark system as under-determined
+            solvable_for = unknowns
+
+        return {
+            "success": True,
+            "equation_count": equation_count,
+            "variable_count": len(all_variables),
+            "unknown_count": unknown_count,
+            "known_count": len(knowns),
+            "unknowns": unknowns,
+            "knowns": knowns,
+            "all_variables": all_var_list,
+            "status": status,
+            "message": message,
+            "solvable_for": solvable_for,
+        }
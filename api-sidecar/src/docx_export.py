@@ -114,23 +114,12 @@ def _add_metadata_section(doc: Document, metadata: Dict[str, Any]):
 
 def _add_node(doc: Document, node: Dict[str, Any], index: int):
     """Add a single node to the document."""
-    node_type = node.get('type', 'unknown')
-
-    if node_type == 'text':
-        _add_text_node(doc, node)
-    elif node_type == 'given':
-        _add_given_node(doc, node, index)
-    elif node_type == 'equation':
-        _add_equation_node(doc, node, index)
-    elif node_type == 'result':
-        _add_result_node(doc, node)
-    elif node_type == 'constraint':
-        _add_constraint_node(doc, node)
-    elif node_type == 'solve_goal':
-        _add_solve_goal_node(doc, node)
-
-
-def _add_text_node(doc: Document, node: Dict[str, Any]):
+    writer = _NODE_WRITERS.get(node.get('type'))
+    if writer is not None:
+        writer(doc, node, index)
+
+
+def _add_text_node(doc: Document, node: Dict[str, Any], index: int):
     """Add a text node as a paragraph."""
     content = node.get('content', '')
     p = doc.add_paragraph(content)
@@ -188,7 +177,7 @@ def _add_equation_node(doc: Document, node: Dict[str, Any], index: int):
     eq.style = 'Equation'
 
 
-def _add_result_node(doc: Document, node: Dict[str, Any]):
+def _add_result_node(doc: Document, node: Dict[str, Any], index: int):
     """Add a result node (computed value)."""
     symbol = node.get('symbol', '?')
     value_obj = node.get('value', {})
@@ -221,7 +210,7 @@ def _add_result_node(doc: Document, node: Dict[str, Any]):
         verified.paragraph_format.left_indent = Inches(0.5)
 
 
-def _add_constraint_node(doc: Document, node: Dict[str, Any]):
+def _add_constraint_node(doc: Document, node: Dict[str, Any], index: int):
     """Add a constraint node."""
     latex = node.get('latex', '')
     sympy = node.get('sympy', '')
@@ -247,7 +236,7 @@ def _add_constraint_node(doc: Document, node: Dict[str, Any]):
         desc.runs[0].font.size = Pt(10)
 
 
-def _add_solve_goal_node(doc: Document, node: Dict[str, Any]):
+def _add_solve_goal_node(doc: Document, node: Dict[str, Any], index: int):
     """Add a solve goal node."""
     target = node.get('target_symbol', '?')
     method = node.get('method', 'auto')
@@ -258,6 +247,17 @@ def _add_solve_goal_node(doc: Document, node: Dict[str, Any]):
         label.add_run(f' (method: {method})')
 
 
+# Node type tag -> writer(doc, node, index); other node types are skipped
+_NODE_WRITERS = {
+    'text': _add_text_node,
+    'given': _add_given_node,
+    'equation': _add_equation_node,
+    'result': _add_result_node,
+    'constraint': _add_constraint_node,
+    'solve_goal': _add_solve_goal_node,
+}
+
+
 def _add_assumptions_section(doc: Document, assumptions: List[Dict[str, Any]]):
     """Add assumptions section at the end of document."""
     doc.add_heading('Assumptions', level=1)
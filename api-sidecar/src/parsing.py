@@ -2,9 +2,14 @@
 Shared parsing utilities for the compute engine.
 """
 
+from functools import lru_cache
 from typing import Tuple
 
+# Equation sets are re-sent with new values, so splits repeat constantly
+EQUATION_CACHE_SIZE = 2048
 
+
+@lru_cache(maxsize=EQUATION_CACHE_SIZE)
 def parse_equation(eq_str: str) -> Tuple[str, str]:
     """
     Split an equation string into LHS and RHS.
@@ -18,10 +23,11 @@ def parse_equation(eq_str: str) -> Tuple[str, str]:
     Returns:
         Tuple of (lhs, rhs) stripped of whitespace
     """
-    if ":=" in eq_str:
-        lhs, rhs = eq_str.split(":=", 1)
-    elif "=" in eq_str:
-        lhs, rhs = eq_str.split("=", 1)
-    else:
-        return (eq_str.strip(), "0")
-    return (lhs.strip(), rhs.strip())
+    # find + slice: one scan per operator instead of `in` followed by split
+    i = eq_str.find(":=")
+    if i != -1:
+        return (eq_str[:i].strip(), eq_str[i + 2:].strip())
+    i = eq_str.find("=")
+    if i != -1:
+        return (eq_str[:i].strip(), eq_str[i + 1:].strip())
+    return (eq_str.strip(), "0")
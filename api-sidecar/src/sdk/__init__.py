@@ -10,26 +10,30 @@ Usage:
     ws.export_csv("results.csv")
 """
 
-from .worksheet import Worksheet
-from .models import (
-    WorksheetDocument,
-    WorksheetNode,
-    BaseNode,
-    GivenNode,
-    EquationNode,
-    ResultNode,
-    SolveGoalNode,
-    ConstraintNode,
-    TextNode,
-    AnnotationNode,
-    PlotNode,
-    Assumption,
-    ValueWithUnit,
-    Unit,
-    SolveResult,
-)
-from .client import SidecarClient
-from .export import export_csv, export_json
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .worksheet import Worksheet
+    from .models import (
+        WorksheetDocument,
+        WorksheetNode,
+        BaseNode,
+        GivenNode,
+        EquationNode,
+        ResultNode,
+        SolveGoalNode,
+        ConstraintNode,
+        TextNode,
+        AnnotationNode,
+        PlotNode,
+        Assumption,
+        ValueWithUnit,
+        Unit,
+        SolveResult,
+    )
+    from .client import SidecarClient
+    from .export import export_csv, export_json
 
 __version__ = "0.1.0"
 
@@ -54,3 +58,20 @@ __all__ = [
     "export_csv",
     "export_json",
 ]
+
+# Submodules load on first attribute access so `provecalc --help` and
+# `provecalc serve` don't import pydantic, pint and httpx up front
+_LAZY_MODULES = {
+    "Worksheet": ".worksheet",
+    "SidecarClient": ".client",
+    "export_csv": ".export",
+    "export_json": ".export",
+}
+
+
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_MODULES.get(name, ".models"), __name__), name)
+    globals()[name] = value
+    return value
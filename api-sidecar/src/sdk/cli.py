@@ -9,15 +9,119 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
 import logging
 import sys
+from contextlib import contextmanager
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    import argparse
 
 logger = logging.getLogger(__name__)
 
 
-def main(argv: list[str] | None = None) -> int:
+_COMMANDS = ("run", "serve", "export", "info")
+
+# Per-command (short, long, dest, default) options that take a value
+_COMMAND_FLAGS = {
+    "run": (),
+    "serve": (),
+    "export": (("-f", "--format", "format", "csv"), ("-o", "--output", "output", None)),
+    "info": (),
+}
+_COMMAND_POSITIONALS = {
+    "run": ("script",),
+    "serve": (),
+    "export": ("input",),
+    "info": ("input",),
+}
+_FORMAT_CHOICES = ("csv", "json")
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None if there isn't a known one."""
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _COMMANDS else None
+    return None
+
+
+def _parse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse well-formed command lines without argparse.
+
+    Returns None for anything it doesn't fully understand (help flags,
+    unknown options, missing arguments) so argparse can print the usual
+    help or error message.
+    """
+    verbose = False
+    i, n = 0, len(argv)
+    while i < n and argv[i] in ("-v", "--verbose"):
+        verbose = True
+        i += 1
+    if i == n or argv[i] not in _COMMANDS:
+        return None
+    command = argv[i]
+    i += 1
+
+    flags = _COMMAND_FLAGS[command]
+    positionals = _COMMAND_POSITIONALS[command]
+    values = {dest: default for _, _, dest, default in flags}
+    found: list[str] = []
+    extra: list[str] = []
+    while i < n:
+        token = argv[i]
+        if token.startswith("-") and token != "-":
+            for short, long, dest, _ in flags:
+                if token == short or token == long:
+                    break
+            else:
+                return None
+            if i + 1 == n:
+                return None
+            values[dest] = argv[i + 1]
+            i += 2
+        elif len(found) < len(positionals):
+            found.append(token)
+            i += 1
+        elif command == "run":
+            extra.append(token)
+            i += 1
+        else:
+            return None
+
+    if len(found) < len(positionals):
+        return None
+    if command == "export" and values["format"] not in _FORMAT_CHOICES:
+        return None
+    values.update(zip(positionals, found))
+    if command == "run":
+        values["args"] = extra
+    return SimpleNamespace(command=command, verbose=verbose, **values)
+
+
+def _add_subparser(sub: argparse._SubParsersAction, command: str) -> None:
+    if command == "run":
+        run_parser = sub.add_parser("run", help="Execute a Python script with provecalc imported")
+        run_parser.add_argument("script", type=str, help="Path to Python script")
+        run_parser.add_argument("args", nargs="*", help="Arguments passed to the script")
+    elif command == "serve":
+        sub.add_parser("serve", help="Start the compute sidecar server")
+    elif command == "export":
+        export_parser = sub.add_parser("export", help="Export a worksheet to CSV or JSON")
+        export_parser.add_argument("input", type=str, help="Input .worksheet file")
+        export_parser.add_argument("-f", "--format", choices=list(_FORMAT_CHOICES), default="csv", help="Output format")
+        export_parser.add_argument("-o", "--output", type=str, help="Output file path")
+    elif command == "info":
+        info_parser = sub.add_parser("info", help="Display worksheet summary")
+        info_parser.add_argument("input", type=str, help="Input .worksheet file")
+
+
+def _parse_with_argparse(argv: list[str]) -> argparse.Namespace:
+    """Full argparse parse, used for help output and error reporting."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="provecalc",
         description="ProveCalc headless automation CLI",
@@ -25,39 +129,24 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
     sub = parser.add_subparsers(dest="command", required=True)
 
-    # --- run ---
-    run_parser = sub.add_parser("run", help="Execute a Python script with provecalc imported")
-    run_parser.add_argument("script", type=str, help="Path to Python script")
-    run_parser.add_argument("args", nargs="*", help="Arguments passed to the script")
+    # Only build the subparser that was asked for; help and errors get all of them
+    command = _sniff_subcommand(argv)
+    for name in (command,) if command else _COMMANDS:
+        _add_subparser(sub, name)
 
-    # --- serve ---
-    sub.add_parser("serve", help="Start the compute sidecar server")
+    return parser.parse_args(argv)
 
-    # --- export ---
-    export_parser = sub.add_parser("export", help="Export a worksheet to CSV or JSON")
-    export_parser.add_argument("input", type=str, help="Input .worksheet file")
-    export_parser.add_argument("-f", "--format", choices=["csv", "json"], default="csv", help="Output format")
-    export_parser.add_argument("-o", "--output", type=str, help="Output file path")
 
-    # --- info ---
-    info_parser = sub.add_parser("info", help="Display worksheet summary")
-    info_parser.add_argument("input", type=str, help="Input .worksheet file")
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
 
-    args = parser.parse_args(argv)
+    args = _parse(argv) or _parse_with_argparse(argv)
 
     level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
 
-    if args.command == "run":
-        return _cmd_run(args)
-    elif args.command == "serve":
-        return _cmd_serve()
-    elif args.command == "export":
-        return _cmd_export(args)
-    elif args.command == "info":
-        return _cmd_info(args)
-
-    return 1
+    return _DISPATCH[args.command](args)
 
 
 def _cmd_run(args: argparse.Namespace) -> int:
@@ -69,38 +158,43 @@ def _cmd_run(args: argparse.Namespace) -> int:
 
     import importlib.util
 
-    # Save originals for restoration
-    orig_argv = sys.argv[:]
-    orig_path = sys.path[:]
-
-    # Inject script args and make script dir importable
-    sys.argv = [str(script_path)] + (args.args or [])
-    sys.path.insert(0, str(script_path.parent))
-
     spec = importlib.util.spec_from_file_location("__main__", script_path)
     if spec is None or spec.loader is None:
         logger.error("Cannot load script: %s", script_path)
-        sys.argv = orig_argv
-        sys.path = orig_path
         return 1
 
     module = importlib.util.module_from_spec(spec)
     module.__name__ = "__main__"
-    try:
-        spec.loader.exec_module(module)
-    except SystemExit as e:
-        return e.code if isinstance(e.code, int) else 0
-    except Exception as e:
-        logger.error("Error in script: %s", e)
-        return 1
-    finally:
-        sys.argv = orig_argv
-        sys.path = orig_path
+    # Inject script args and make script dir importable
+    with _saved_interpreter_state([str(script_path)] + (args.args or []), script_path.parent):
+        try:
+            spec.loader.exec_module(module)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 0
+        except Exception as e:
+            logger.error("Error in script: %s", e)
+            return 1
 
     return 0
 
 
-def _cmd_serve() -> int:
+@contextmanager
+def _saved_interpreter_state(argv: list[str], script_dir: Path) -> Iterator[None]:
+    """Swap in a script's sys.argv/sys.path, restoring the originals on exit.
+
+    New lists are bound rather than the live ones being edited, so the saved
+    references are restored as-is without taking copies up front.
+    """
+    saved_argv, saved_path = sys.argv, sys.path
+    sys.argv = argv
+    sys.path = [str(script_dir), *saved_path]
+    try:
+        yield
+    finally:
+        sys.argv, sys.path = saved_argv, saved_path
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
     """Start the compute sidecar."""
     import uvicorn
     sidecar_dir = Path(__file__).resolve().parent.parent.parent
@@ -138,7 +232,6 @@ def _cmd_export(args: argparse.Namespace) -> int:
 def _cmd_info(args: argparse.Namespace) -> int:
     """Display worksheet summary."""
     from .worksheet import Worksheet
-    from .models import GivenNode, EquationNode, ResultNode
 
     input_path = Path(args.input)
     if not input_path.exists():
@@ -156,9 +249,7 @@ def _cmd_info(args: argparse.Namespace) -> int:
     logger.info("  Nodes: %s", len(doc.nodes))
     logger.info("  Assumptions: %s", len(doc.assumptions))
 
-    givens = [n for n in doc.nodes if isinstance(n, GivenNode)]
-    equations = [n for n in doc.nodes if isinstance(n, EquationNode)]
-    results = [n for n in doc.nodes if isinstance(n, ResultNode)]
+    givens, equations, results = doc.givens, doc.equations, doc.results
 
     if givens:
         logger.info("Givens:")
@@ -180,5 +271,14 @@ def _cmd_info(args: argparse.Namespace) -> int:
     return 0
 
 
+# Subcommand handlers; every entry in _COMMANDS has one
+_DISPATCH = {
+    "run": _cmd_run,
+    "serve": _cmd_serve,
+    "export": _cmd_export,
+    "info": _cmd_info,
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -3,31 +3,190 @@
 from __future__ import annotations
 
 import logging
+import os
+import signal
+import stat
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import httpx
+try:
+    import orjson as _orjson
+except ImportError:  # optional; httpx's stdlib json codec is used instead
+    _orjson = None
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_SIDECAR_URL = "http://127.0.0.1:9743"
 HEALTH_TIMEOUT = 2.0
 REQUEST_TIMEOUT = 30.0
+KEEPALIVE_CONNECTIONS = 4
+KEEPALIVE_EXPIRY = 30.0
+
+# Daemon mode: the sidecar outlives the client, reached over a Unix socket
+# where available, and advertised through a pidfile. Both live in a private
+# per-user runtime directory (see runtime_dir) unless paths are passed in.
+SOCKET_NAME = "provecalc.sock"
+PIDFILE_NAME = "provecalc.pid"
+STOP_TIMEOUT = 5.0
+_UDS_BASE_URL = "http://provecalc"
+_POLL_INITIAL = 0.01
+_POLL_MAX = 0.2
+# ensure_running trusts the last successful health check/request this long
+HEALTH_RECHECK_INTERVAL = 30.0
+
+# uvicorn prints these once the app can take requests
+_READY_MARKERS = ("Application startup complete", "Uvicorn running on")
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# httpx is imported on first client construction so CLI paths that never
+# talk to the sidecar don't pay for it
+_httpx = None
+
+
+def _load_httpx():
+    global _httpx
+    if _httpx is None:
+        import httpx
+        _httpx = httpx
+    return _httpx
+
+
+def runtime_dir() -> str:
+    """
+    Private per-user directory for the daemon socket and pidfile.
+
+    $XDG_RUNTIME_DIR/provecalc when set, else provecalc-<uid> in the temp
+    dir. Created with mode 0700; an existing directory that another user
+    owns or that others can access is refused, so nobody else can plant a
+    socket or pidfile there.
+    """
+    xdg = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg:
+        path = os.path.join(xdg, "provecalc")
+    else:
+        owner = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+        path = os.path.join(tempfile.gettempdir(), f"provecalc-{owner}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise RuntimeError(f"Sidecar runtime path {path} is not a directory")
+    if hasattr(os, "getuid"):
+        if st.st_uid != os.getuid():
+            raise RuntimeError(f"Sidecar runtime directory {path} is owned by another user")
+        if st.st_mode & 0o077:
+            raise RuntimeError(f"Sidecar runtime directory {path} is accessible to other users")
+    return path
+
+
+def _pid_alive(pid: int) -> bool:
+    if sys.platform == "win32":
+        # os.kill on Windows terminates the process instead of probing it
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _reap(pid: int) -> None:
+    """Collect `pid` if it is an exited child of this process, so it stops looking alive."""
+    if hasattr(os, "WNOHANG"):
+        try:
+            os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            pass  # Not our child; its parent reaps it
+
+
+def _pid_command(pid: int) -> Optional[str]:
+    """Command line of `pid`, or None where it can't be read."""
+    try:
+        return Path(f"/proc/{pid}/cmdline").read_bytes().replace(b"\0", b" ").decode(errors="replace")
+    except OSError:
+        pass
+    if sys.platform == "win32":
+        return None
+    try:
+        out = subprocess.run(
+            ["ps", "-p", str(pid), "-o", "command="],
+            capture_output=True, text=True, timeout=HEALTH_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() if out.returncode == 0 else None
+
+
+def _watch_output(stream, ready: threading.Event) -> None:
+    """Drain sidecar output, setting `ready` at startup or when the process exits."""
+    for line in stream:
+        if not ready.is_set() and any(marker in line for marker in _READY_MARKERS):
+            ready.set()
+    ready.set()
 
 
 class SidecarClient:
     """HTTP client wrapping calls to the Python sidecar (FastAPI)."""
 
-    def __init__(self, base_url: str = DEFAULT_SIDECAR_URL, timeout: float = REQUEST_TIMEOUT):
-        self.base_url = base_url.rstrip("/")
-        self._client = httpx.Client(base_url=self.base_url, timeout=timeout)
+    def __init__(
+        self,
+        base_url: str = DEFAULT_SIDECAR_URL,
+        timeout: float = REQUEST_TIMEOUT,
+        transport: str = "tcp",
+        daemon: bool = False,
+        socket_path: Optional[str] = None,
+        pidfile: Optional[str] = None,
+    ):
+        if transport not in ("tcp", "uds"):
+            raise ValueError(f"Unknown transport '{transport}'; use 'tcp' or 'uds'")
+        if transport == "uds" and sys.platform == "win32":
+            raise ValueError("Unix domain sockets are not supported on Windows; use transport='tcp'")
+        httpx = _load_httpx()
+        # Keep loopback connections open between calls; ensure_running's
+        # health probe leaves one warm for the first request
+        limits = httpx.Limits(
+            max_keepalive_connections=KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        if socket_path is None and transport == "uds":
+            socket_path = os.path.join(runtime_dir(), SOCKET_NAME)
+        if pidfile is None and daemon:
+            pidfile = os.path.join(runtime_dir(), PIDFILE_NAME)
+        self.transport = transport
+        self.daemon = daemon
+        self.socket_path = socket_path
+        self.pidfile = pidfile
+        if transport == "uds":
+            self.base_url = _UDS_BASE_URL
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                transport=httpx.HTTPTransport(uds=socket_path, limits=limits),
+                timeout=timeout,
+            )
+        else:
+            self.base_url = base_url.rstrip("/")
+            self._client = httpx.Client(base_url=self.base_url, limits=limits, timeout=timeout)
         self._process: Optional[subprocess.Popen] = None
+        self._ready: Optional[threading.Event] = None
+        # time.monotonic() of the last evidence the sidecar was up, or None
+        self._healthy_at: Optional[float] = None
 
     def close(self):
         self._client.close()
+        self._healthy_at = None
+        if self.daemon:
+            # Leave the daemon running for the next client
+            self._process = None
         if self._process is not None:
             try:
                 self._process.terminate()
@@ -56,36 +215,144 @@ class SidecarClient:
         try:
             resp = self._client.get("/health", timeout=HEALTH_TIMEOUT)
             return resp.status_code == 200
-        except (httpx.ConnectError, httpx.TimeoutException):
+        except (_httpx.ConnectError, _httpx.TimeoutException):
             return False
 
+    def daemon_pid(self) -> Optional[int]:
+        """
+        PID of the live sidecar daemon from the pidfile, or None.
+
+        The process must still be a sidecar (serving this socket, for the
+        uds transport); a pidfile left by a dead daemon whose PID was reused
+        is removed.
+        """
+        if self.pidfile is None:
+            return None
+        try:
+            pid = int(Path(self.pidfile).read_text().strip())
+        except (OSError, ValueError):
+            return None
+        if _pid_alive(pid):
+            command = _pid_command(pid)
+            if command is None:
+                return pid  # can't tell; trust the live PID
+            if "src.main:app" in command and (self.transport != "uds" or self.socket_path in command):
+                return pid
+        logger.info("Removing stale sidecar pidfile %s (pid %d)", self.pidfile, pid)
+        self._remove_daemon_files()
+        return None
+
+    def stop_daemon(self, timeout: float = STOP_TIMEOUT) -> bool:
+        """
+        Stop the sidecar daemon named by the pidfile and remove its pidfile
+        and socket. Returns True if a running daemon was stopped.
+        """
+        pid = self.daemon_pid()
+        self._healthy_at = None
+        if pid is None:
+            return False
+        try:
+            os.kill(pid, signal.SIGTERM)
+            deadline = time.monotonic() + timeout
+            delay = _POLL_INITIAL
+            _reap(pid)
+            while _pid_alive(pid) and time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 2, _POLL_MAX)
+                _reap(pid)
+            if _pid_alive(pid):
+                logger.warning("Sidecar daemon (pid %d) did not terminate gracefully, killing", pid)
+                os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        except ProcessLookupError:
+            pass  # Already exited
+        self._remove_daemon_files()
+        return True
+
+    def _remove_daemon_files(self) -> None:
+        paths = [self.pidfile]
+        if self.transport == "uds":
+            paths.append(self.socket_path)
+        for path in paths:
+            if path is None:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not remove %s: %s", path, e)
+
     def ensure_running(self, max_wait: float = 15.0) -> None:
         """Start the sidecar if not already running, wait until healthy."""
+        healthy_at = self._healthy_at
+        if healthy_at is not None and time.monotonic() - healthy_at < HEALTH_RECHECK_INTERVAL:
+            return
         if self.is_healthy():
+            self._healthy_at = time.monotonic()
             return
 
-        logger.info("Sidecar not running, starting...")
-        self._start_sidecar()
+        pid = self.daemon_pid() if self.daemon else None
+        if pid is not None:
+            # A daemon is still starting up; wait for it instead of spawning another
+            logger.info("Waiting for sidecar daemon (pid %d)...", pid)
+        else:
+            logger.info("Sidecar not running, starting...")
+            self._start_sidecar()
 
         deadline = time.monotonic() + max_wait
+        if self._ready is not None:
+            # Block on uvicorn's startup line; the health probe below confirms it
+            self._ready.wait(timeout=max_wait)
+
+        delay = _POLL_INITIAL
         while time.monotonic() < deadline:
             if self.is_healthy():
                 logger.info("Sidecar is ready")
+                self._healthy_at = time.monotonic()
                 return
-            time.sleep(0.5)
+            if self._process is not None and self._process.poll() is not None:
+                raise RuntimeError(f"Sidecar exited with code {self._process.returncode} during startup")
+            time.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX)
 
         raise RuntimeError(f"Sidecar did not become healthy within {max_wait}s")
 
     def _start_sidecar(self) -> None:
         """Start the sidecar process."""
         sidecar_dir = Path(__file__).resolve().parent.parent.parent  # sidecar/
+        cmd = [sys.executable, "-m", "uvicorn", "src.main:app"]
+        if self.transport == "uds":
+            cmd += ["--uds", self.socket_path]
+        else:
+            cmd += ["--host", "127.0.0.1", "--port", "9743"]
+        if self.daemon:
+            # Detach daemons so they survive the CLI process exiting; they
+            # can't write to a pipe this process stops reading
+            self._process = subprocess.Popen(
+                cmd,
+                cwd=str(sidecar_dir),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            Path(self.pidfile).write_text(str(self._process.pid))
+            return
+
         self._process = subprocess.Popen(
-            [sys.executable, "-m", "uvicorn", "src.main:app",
-             "--host", "127.0.0.1", "--port", "9743"],
+            cmd,
             cwd=str(sidecar_dir),
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
         )
+        self._ready = threading.Event()
+        threading.Thread(
+            target=_watch_output,
+            args=(self._process.stdout, self._ready),
+            name="provecalc-sidecar-output",
+            daemon=True,
+        ).start()
 
     # --- Compute Endpoints ---
 
@@ -189,6 +456,15 @@ class SidecarClient:
             "point_count": points,
         })
 
+    def batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several compute calls in one round-trip.
+
+        Each call is a compute endpoint payload plus an "op" key naming the
+        endpoint, e.g. {"op": "evaluate", "expression": "2*x", "variables": {"x": 3}}.
+        Returns one result per call, in order.
+        """
+        return self._post("/compute/batch", {"calls": calls})["results"]
+
     # --- Unit Endpoints ---
 
     def convert_units(self, value: float, from_unit: str, to_unit: str) -> Dict[str, Any]:
@@ -197,7 +473,7 @@ class SidecarClient:
             params={"value": value, "from_unit": from_unit, "to_unit": to_unit},
         )
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
 
     def get_dimensions(self, unit: str) -> Dict[str, Any]:
         return self._get(f"/units/dimensions/{unit}")
@@ -222,11 +498,32 @@ class SidecarClient:
     # --- Internal ---
 
     def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        resp = self._client.post(path, json=payload)
+        try:
+            if _orjson is not None:
+                body = _orjson.dumps(payload, option=_orjson.OPT_SERIALIZE_NUMPY)
+                resp = self._client.post(path, content=body, headers=_JSON_HEADERS)
+            else:
+                resp = self._client.post(path, json=payload)
+        except _httpx.TransportError:
+            # Make the next ensure_running probe again
+            self._healthy_at = None
+            raise
+        self._healthy_at = time.monotonic()
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
 
     def _get(self, path: str) -> Dict[str, Any]:
-        resp = self._client.get(path)
+        try:
+            resp = self._client.get(path)
+        except _httpx.TransportError:
+            self._healthy_at = None
+            raise
+        self._healthy_at = time.monotonic()
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
+
+
+def _decode(resp) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(resp.content)
+    return resp.json()
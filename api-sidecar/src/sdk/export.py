@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import csv
-import json
+import os
 from pathlib import Path
 from typing import Union
 
-from .models import GivenNode, ResultNode, WorksheetDocument
+from .models import WorksheetDocument
+
+CSV_COLUMNS = ("symbol", "value", "unit", "type", "description")
+CSV_BUFFER_SIZE = 1 << 20
+
+# Characters that make csv quote a field, and its default line terminator
+_CSV_SPECIAL = frozenset(',"\r\n')
+_CSV_LINE_END = "\r\n"
 
 
 def export_csv(document: WorksheetDocument, path: Union[str, Path]) -> None:
@@ -15,36 +22,31 @@ def export_csv(document: WorksheetDocument, path: Union[str, Path]) -> None:
 
     Columns: symbol, value, unit, type, description
     """
-    path = Path(path)
-    rows = []
-
-    for node in document.nodes:
-        if isinstance(node, GivenNode):
-            rows.append({
-                "symbol": node.symbol,
-                "value": node.value.value,
-                "unit": node.value.unit.expression if node.value.unit else "",
-                "type": "given",
-                "description": node.description or "",
-            })
-        elif isinstance(node, ResultNode):
-            rows.append({
-                "symbol": node.symbol,
-                "value": node.value.value,
-                "unit": node.value.unit.expression if node.value.unit else "",
-                "type": "result",
-                "description": node.symbolic_form or "",
-            })
-
-    fieldnames = ["symbol", "value", "unit", "type", "description"]
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    with open(os.fspath(path), "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        write = f.write
+        for node in document.nodes:
+            match node.type:
+                case "given":
+                    description = node.description or ""
+                case "result":
+                    description = node.symbolic_form or ""
+                case _:
+                    continue
+            unit = node.value.unit.expression if node.value.unit else ""
+            row = (node.symbol, str(node.value.value), unit, node.type, description)
+            # Plain rows are joined directly; csv only handles the ones needing quotes
+            if _CSV_SPECIAL.isdisjoint(node.symbol) and _CSV_SPECIAL.isdisjoint(unit) \
+                    and _CSV_SPECIAL.isdisjoint(description):
+                write(",".join(row) + _CSV_LINE_END)
+            else:
+                writer.writerow(row)
 
 
 def export_json(document: WorksheetDocument, path: Union[str, Path]) -> None:
     """Export the full document as formatted JSON."""
     path = Path(path)
-    data = document.model_dump(by_alias=True, exclude_none=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # pydantic-core serializes straight to JSON without an intermediate dict
+    payload = document.model_dump_json(by_alias=True, exclude_none=True, indent=2)
+    path.write_bytes(payload.encode("utf-8"))
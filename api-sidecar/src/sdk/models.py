@@ -8,20 +8,54 @@ field names as serialized by Rust's serde.
 from __future__ import annotations
 
 import logging
+import os
 import uuid
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
 
-import pint
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-
-from ..units import UnitRegistry as _UnitRegistry
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, PrivateAttr, field_validator, model_validator
 
 logger = logging.getLogger(__name__)
 
-# Use the shared UnitRegistry so custom units are available
-_registry = _UnitRegistry()
-_ureg = _registry.ureg
+# The shared UnitRegistry (so custom units are available) is built on first
+# unit validation; loading pint's definitions is the bulk of this module's
+# import cost and CLI paths like `provecalc info` may never need it
+_ureg = None
+
+
+def _load_ureg():
+    global _ureg
+    if _ureg is None:
+        from ..units import UnitRegistry as _UnitRegistry
+        _ureg = _UnitRegistry().ureg
+    return _ureg
+
+
+# Worksheets repeat a handful of unit strings across many nodes
+UNIT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _parse_unit(expr: str) -> Tuple[Optional[str], Optional[str]]:
+    """(Pint error, SI base units) for a unit expression, from one parse.
+
+    Exactly one of the two is set. Failures are cached too, so a bad unit
+    isn't re-parsed on every node.
+    """
+    ureg = _load_ureg()
+    import pint
+
+    try:
+        quantity = ureg.parse_expression(expr)
+    except (pint.UndefinedUnitError, pint.errors.UndefinedUnitError) as e:
+        return str(e), None
+    return None, str(quantity.to_base_units().units)
+
+
+# Provenance and verification records are replaced, never edited in place
+_FROZEN = ConfigDict(frozen=True)
 
 
 # --- Provenance ---
@@ -30,22 +64,30 @@ class UserProvenance(BaseModel):
     type: Literal["user"] = "user"
     timestamp: str
 
+    model_config = _FROZEN
+
 class LLMProvenance(BaseModel):
     type: Literal["llm"] = "llm"
     timestamp: str
     model: Optional[str] = None
     accepted_by: Optional[str] = None
 
+    model_config = _FROZEN
+
 class LibraryProvenance(BaseModel):
     type: Literal["library"] = "library"
     source: str
     timestamp: str
 
+    model_config = _FROZEN
+
 class ComputedProvenance(BaseModel):
     type: Literal["computed"] = "computed"
     from_nodes: List[str]
     timestamp: str
 
+    model_config = _FROZEN
+
 Provenance = Annotated[
     Union[UserProvenance, LLMProvenance, LibraryProvenance, ComputedProvenance],
     Field(discriminator="type"),
@@ -57,19 +99,27 @@ Provenance = Annotated[
 class Unverified(BaseModel):
     status: Literal["unverified"] = "unverified"
 
+    model_config = _FROZEN
+
 class Verified(BaseModel):
     status: Literal["verified"] = "verified"
     timestamp: str
     engine_version: str
 
+    model_config = _FROZEN
+
 class VerificationFailed(BaseModel):
     status: Literal["failed"] = "failed"
     reason: str
     timestamp: str
 
+    model_config = _FROZEN
+
 class Pending(BaseModel):
     status: Literal["pending"] = "pending"
 
+    model_config = _FROZEN
+
 VerificationStatus = Annotated[
     Union[Unverified, Verified, VerificationFailed, Pending],
     Field(discriminator="status"),
@@ -88,32 +138,27 @@ class Unit(BaseModel):
     @classmethod
     def validate_unit_expression(cls, v: str) -> str:
         """Validate that the unit expression is parseable by Pint."""
-        try:
-            _ureg.parse_expression(v)
-        except (pint.UndefinedUnitError, pint.errors.UndefinedUnitError) as e:
-            raise ValueError(f"Invalid unit expression '{v}': {e}") from e
+        error, _ = _parse_unit(v)
+        if error is not None:
+            raise ValueError(f"Invalid unit expression '{v}': {error}")
         return v
 
+    @model_validator(mode="after")
+    def fill_si_base(self) -> Unit:
+        """Normalize si_base from the same cached parse, if not already set.
+
+        Saved documents carry it; new units get it when they are created, so
+        later reads never go back to Pint.
+        """
+        if self.expression and self.si_base is None:
+            _, self.si_base = _parse_unit(self.expression)
+        return self
+
 class ValueWithUnit(BaseModel):
     value: float
     unit: Optional[Unit] = None
     uncertainty: Optional[float] = None
 
-    @field_validator("unit")
-    @classmethod
-    def validate_unit(cls, v: Optional[Unit]) -> Optional[Unit]:
-        """Ensure any provided Unit has a valid, Pint-parsed expression."""
-        if v is not None and v.expression:
-            try:
-                parsed = _ureg.parse_expression(v.expression)
-                # Normalize si_base if not already set
-                if v.si_base is None:
-                    v.si_base = str(parsed.to_base_units().units)
-            except (pint.UndefinedUnitError, pint.errors.UndefinedUnitError):
-                # Already validated in Unit; this is a safety net
-                pass
-        return v
-
 class NodePosition(BaseModel):
     x: float
     y: float
@@ -261,13 +306,49 @@ class PlotOptions(BaseModel):
     show_points: Optional[bool] = None
     point_count: Optional[int] = None
 
+def _to_float_array(v: Any) -> np.ndarray:
+    """Pack plot samples into a contiguous float64 array (null -> NaN)."""
+    if isinstance(v, np.ndarray) and v.dtype == np.float64:
+        return v
+    try:
+        return np.array([np.nan if x is None else x for x in v], dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Expected a list of numbers: {e}") from e
+
+def _float_array_to_list(v: np.ndarray) -> List[Optional[float]]:
+    """Back to JSON numbers, with NaN written as null like the sidecar does."""
+    out = v.tolist()
+    if np.isnan(v).any():
+        out = [None if x != x else x for x in out]
+    return out
+
+# Sample arrays stored as 8-byte doubles instead of lists of Python floats
+FloatArray = Annotated[
+    np.ndarray,
+    PlainValidator(_to_float_array),
+    PlainSerializer(_float_array_to_list, return_type=List[Optional[float]]),
+]
+
 class PlotSeriesData(BaseModel):
     expression_id: str
-    x: List[float]
-    y: List[float]
+    x: FloatArray
+    y: FloatArray
     label: Optional[str] = None
     color: Optional[str] = None
 
+    def __eq__(self, other: Any) -> bool:
+        # pydantic's field-wise compare can't take the truth value of an array;
+        # NaN samples (null in JSON) compare equal like the None they came from
+        if not isinstance(other, PlotSeriesData):
+            return NotImplemented
+        return (
+            self.expression_id == other.expression_id
+            and self.label == other.label
+            and self.color == other.color
+            and np.array_equal(self.x, other.x, equal_nan=True)
+            and np.array_equal(self.y, other.y, equal_nan=True)
+        )
+
 class PlotData(BaseModel):
     series: List[PlotSeriesData]
     computed_at: str
@@ -363,12 +444,42 @@ class DocumentMetadata(BaseModel):
 
 # --- Document Root ---
 
+def _index_nodes(
+    nodes: List[WorksheetNode],
+    givens: List[GivenNode],
+    equations: List[EquationNode],
+    results: List[ResultNode],
+    by_id: Dict[str, WorksheetNode],
+    given_by_symbol: Dict[str, GivenNode],
+    equations_by_lhs: Dict[str, List[EquationNode]],
+    results_by_symbol: Dict[str, List[ResultNode]],
+    dependents_of: Dict[str, List[WorksheetNode]],
+) -> None:
+    """Add `nodes` to WorksheetDocument's type buckets and indexes, in order."""
+    for node in nodes:
+        by_id.setdefault(node.id, node)
+        for dep_id in node.dependencies:
+            dependents_of.setdefault(dep_id, []).append(node)
+        match node.type:
+            case "given":
+                givens.append(node)
+                given_by_symbol.setdefault(node.symbol, node)
+            case "equation":
+                equations.append(node)
+                equations_by_lhs.setdefault(node.lhs, []).append(node)
+            case "result":
+                results.append(node)
+                results_by_symbol.setdefault(node.symbol, []).append(node)
+
+
 class WorksheetDocument(BaseModel):
     id: str
     name: str
     created_at: str
     updated_at: str
     version: str = "1.0.0"
+    # Edit through append_node/extend_nodes/remove_node; after changing this
+    # list directly, call reindex_nodes() or lookups will miss the change
     nodes: List[WorksheetNode] = Field(default_factory=list)
     assumptions: List[Assumption] = Field(default_factory=list)
     history: List[HistoryEntry] = Field(default_factory=list)
@@ -378,6 +489,233 @@ class WorksheetDocument(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
+    # Nodes bucketed by type and indexed by id/symbol once, instead of
+    # scanning `nodes` on every lookup
+    _givens: List[GivenNode] = PrivateAttr(default_factory=list)
+    _equations: List[EquationNode] = PrivateAttr(default_factory=list)
+    _results: List[ResultNode] = PrivateAttr(default_factory=list)
+    _by_id: Dict[str, WorksheetNode] = PrivateAttr(default_factory=dict)
+    _given_by_symbol: Dict[str, GivenNode] = PrivateAttr(default_factory=dict)
+    _equations_by_lhs: Dict[str, List[EquationNode]] = PrivateAttr(default_factory=dict)
+    _results_by_symbol: Dict[str, List[ResultNode]] = PrivateAttr(default_factory=dict)
+    _dependents_of: Dict[str, List[WorksheetNode]] = PrivateAttr(default_factory=dict)
+    # Flat views for evaluate/solve, built on demand and stored with the node
+    # fields they were built from. Nodes are mutable and handed out to
+    # callers, so each read re-checks those fields and rebuilds on a change.
+    _given_values: Optional[Tuple[tuple, Dict[str, float]]] = PrivateAttr(default=None)
+    _solver_variables: Optional[Tuple[tuple, Dict[str, Any]]] = PrivateAttr(default=None)
+    _solver_equations: Optional[Tuple[tuple, List[str]]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self.reindex_nodes()
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> WorksheetDocument:
+        # Private state is copied separately from `nodes`; re-link the indexes
+        copied = super().__deepcopy__(memo)
+        copied.reindex_nodes()
+        return copied
+
+    @property
+    def givens(self) -> List[GivenNode]:
+        return self._givens
+
+    @property
+    def equations(self) -> List[EquationNode]:
+        return self._equations
+
+    @property
+    def results(self) -> List[ResultNode]:
+        return self._results
+
+    def get_node(self, node_id: str) -> Optional[WorksheetNode]:
+        """First node with this ID."""
+        return self._by_id.get(node_id)
+
+    def find_given(self, symbol: str) -> Optional[GivenNode]:
+        """First given node for this symbol."""
+        return self._given_by_symbol.get(symbol)
+
+    def find_equation(self, lhs: str) -> Optional[EquationNode]:
+        """First equation node with this left-hand side."""
+        equations = self._equations_by_lhs.get(lhs)
+        return equations[0] if equations else None
+
+    def find_result(self, symbol: str) -> Optional[ResultNode]:
+        """Most recent result node for this symbol."""
+        results = self._results_by_symbol.get(symbol)
+        return results[-1] if results else None
+
+    def result_history(self, symbol: str) -> List[ResultNode]:
+        """Result nodes for this symbol, oldest first."""
+        return self._results_by_symbol.get(symbol, [])
+
+    def latest_results(self) -> Dict[str, ResultNode]:
+        """Most recent result node per symbol."""
+        return {symbol: results[-1] for symbol, results in self._results_by_symbol.items()}
+
+    def _given_fields(self) -> tuple:
+        """(symbol, value, unit expression) per given, in order."""
+        fields = []
+        for n in self._givens:
+            value = n.value
+            unit = value.unit
+            fields.append((n.symbol, value.value, unit.expression if unit else None))
+        return tuple(fields)
+
+    def given_values(self) -> Dict[str, float]:
+        """Given values by symbol (last given wins); treat as read-only."""
+        fields = self._given_fields()
+        cached = self._given_values
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+        values = {symbol: value for symbol, value, _unit in fields}
+        self._given_values = (fields, values)
+        return values
+
+    def solver_variables(self) -> Dict[str, Any]:
+        """Solve payload per given symbol: the value, or {"value", "unit"}; read-only."""
+        fields = self._given_fields()
+        cached = self._solver_variables
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+        variables = {
+            symbol: {"value": value, "unit": unit} if unit else value
+            for symbol, value, unit in fields
+        }
+        self._solver_variables = (fields, variables)
+        return variables
+
+    def solver_equations(self) -> List[str]:
+        """Equations as "lhs = rhs" strings, in order; read-only."""
+        fields = tuple((n.lhs, n.rhs) for n in self._equations)
+        cached = self._solver_equations
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+        equations = [f"{lhs} = {rhs}" for lhs, rhs in fields]
+        self._solver_equations = (fields, equations)
+        return equations
+
+    def clear_given_values(self) -> None:
+        """Drop the cached given views (they also rebuild on their own when a given changes)."""
+        self._given_values = None
+        self._solver_variables = None
+
+    def dependents_of(self, node_id: str) -> List[WorksheetNode]:
+        """Nodes that list `node_id` in their dependencies."""
+        return self._dependents_of.get(node_id, [])
+
+    def _index_node(self, node: WorksheetNode) -> None:
+        self._by_id.setdefault(node.id, node)
+        dependents_of = self._dependents_of
+        for dep_id in node.dependencies:
+            dependents_of.setdefault(dep_id, []).append(node)
+        match node.type:
+            case "given":
+                self._givens.append(node)
+                self._given_by_symbol.setdefault(node.symbol, node)
+                self.clear_given_values()
+            case "equation":
+                self._equations.append(node)
+                self._equations_by_lhs.setdefault(node.lhs, []).append(node)
+                self._solver_equations = None
+            case "result":
+                self._results.append(node)
+                self._results_by_symbol.setdefault(node.symbol, []).append(node)
+
+    def _unindex_node(self, node: WorksheetNode) -> None:
+        # Duplicate ids/symbols are rare; fall back to the next match in order
+        if self._by_id.get(node.id) is node:
+            del self._by_id[node.id]
+            for n in self.nodes:
+                if n.id == node.id:
+                    self._by_id[n.id] = n
+                    break
+        dependents_of = self._dependents_of
+        for dep_id in node.dependencies:
+            remaining = [n for n in dependents_of.get(dep_id, ()) if n is not node]
+            if remaining:
+                dependents_of[dep_id] = remaining
+            else:
+                dependents_of.pop(dep_id, None)
+        match node.type:
+            case "given":
+                self._givens[:] = [n for n in self._givens if n is not node]
+                self.clear_given_values()
+                if self._given_by_symbol.get(node.symbol) is node:
+                    del self._given_by_symbol[node.symbol]
+                    for n in self._givens:
+                        if n.symbol == node.symbol:
+                            self._given_by_symbol[n.symbol] = n
+                            break
+            case "equation":
+                self._equations[:] = [n for n in self._equations if n is not node]
+                self._solver_equations = None
+                same_lhs = [n for n in self._equations_by_lhs.get(node.lhs, ()) if n is not node]
+                if same_lhs:
+                    self._equations_by_lhs[node.lhs] = same_lhs
+                else:
+                    self._equations_by_lhs.pop(node.lhs, None)
+            case "result":
+                self._results[:] = [n for n in self._results if n is not node]
+                same_symbol = [
+                    n for n in self._results_by_symbol.get(node.symbol, ()) if n is not node
+                ]
+                if same_symbol:
+                    self._results_by_symbol[node.symbol] = same_symbol
+                else:
+                    self._results_by_symbol.pop(node.symbol, None)
+
+    def reindex_nodes(self) -> None:
+        """Rebuild the node lists and indexes; call after editing `nodes` directly."""
+        # Built in locals and assigned once: every private-attribute read on a
+        # pydantic model goes through __getattr__, which dominates on big loads
+        givens: List[GivenNode] = []
+        equations: List[EquationNode] = []
+        results: List[ResultNode] = []
+        by_id: Dict[str, WorksheetNode] = {}
+        given_by_symbol: Dict[str, GivenNode] = {}
+        equations_by_lhs: Dict[str, List[EquationNode]] = {}
+        results_by_symbol: Dict[str, List[ResultNode]] = {}
+        dependents_of: Dict[str, List[WorksheetNode]] = {}
+        _index_nodes(
+            self.nodes, givens, equations, results, by_id, given_by_symbol,
+            equations_by_lhs, results_by_symbol, dependents_of,
+        )
+        self._givens, self._equations, self._results = givens, equations, results
+        self._by_id, self._given_by_symbol = by_id, given_by_symbol
+        self._equations_by_lhs, self._results_by_symbol = equations_by_lhs, results_by_symbol
+        self._dependents_of = dependents_of
+        self.clear_given_values()
+        self._solver_equations = None
+
+    def append_node(self, node: WorksheetNode) -> None:
+        """Append a node, keeping the lists and indexes in sync."""
+        self.nodes.append(node)
+        self._index_node(node)
+
+    def extend_nodes(self, nodes: List[WorksheetNode]) -> None:
+        """Append several nodes, indexing them in one pass."""
+        self.nodes.extend(nodes)
+        _index_nodes(
+            nodes, self._givens, self._equations, self._results, self._by_id,
+            self._given_by_symbol, self._equations_by_lhs, self._results_by_symbol,
+            self._dependents_of,
+        )
+        self.clear_given_values()
+        self._solver_equations = None
+
+    def remove_node(self, node_id: str) -> Optional[WorksheetNode]:
+        """Remove a node by ID, returning it (or None if not found)."""
+        node = self._by_id.get(node_id)
+        if node is None:
+            return None
+        for i, n in enumerate(self.nodes):
+            if n is node:
+                del self.nodes[i]
+                break
+        self._unindex_node(node)
+        return node
+
 
 # --- Solve Result (SDK convenience type) ---
 
@@ -401,6 +739,11 @@ def _now() -> str:
 def _uuid() -> str:
     return str(uuid.uuid4())
 
+def _uuid_batch(count: int) -> List[str]:
+    # uuid4 ids from a single urandom read instead of one read per id
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
 def make_user_provenance() -> UserProvenance:
     return UserProvenance(timestamp=_now())
 
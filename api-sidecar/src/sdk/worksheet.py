@@ -16,12 +16,12 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import logging
 import uuid
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from .client import SidecarClient
 from .models import (
@@ -47,10 +47,22 @@ from .models import (
     make_computed_provenance,
     _now,
     _uuid,
+    _uuid_batch,
 )
 
 logger = logging.getLogger(__name__)
 
+# sdk.export (and its csv import) is only loaded on first export, then reused
+_export = None
+
+
+def _load_export():
+    global _export
+    if _export is None:
+        from . import export
+        _export = export
+    return _export
+
 
 class Worksheet:
     """High-level API for working with ProveCalc worksheets programmatically.
@@ -64,10 +76,18 @@ class Worksheet:
         document: WorksheetDocument,
         client: Optional[SidecarClient] = None,
         auto_start: bool = True,
+        track_history: bool = True,
+        history_limit: Optional[int] = None,
     ):
+        if history_limit is not None and history_limit < 2:
+            raise ValueError("history_limit must be at least 2 (a checkpoint plus the latest entry)")
         self._doc = document
         self._client = client or SidecarClient()
         self._auto_start = auto_start
+        # Batch builders can skip the per-mutation node snapshot in history
+        self._track_history = track_history
+        # Older entries past this many are folded into a single checkpoint
+        self._history_limit = history_limit
 
     # --- Factory Methods ---
 
@@ -101,8 +121,8 @@ class Worksheet:
     def load(cls, path: Union[str, Path], **kwargs) -> Worksheet:
         """Load a worksheet from a .worksheet file."""
         path = Path(path)
-        data = json.loads(path.read_text(encoding="utf-8"))
-        doc = WorksheetDocument.model_validate(data)
+        # Parse and validate in one pass in pydantic-core
+        doc = WorksheetDocument.model_validate_json(path.read_bytes())
         logger.info("Loaded worksheet '%s' with %d nodes", doc.name, len(doc.nodes))
         return cls(doc, **kwargs)
 
@@ -117,8 +137,15 @@ class Worksheet:
         self._doc.name = value
 
     @property
-    def nodes(self) -> List[WorksheetNode]:
-        return self._doc.nodes
+    def nodes(self) -> Tuple[WorksheetNode, ...]:
+        """
+        Read-only snapshot of the nodes in document order.
+
+        Lookups go through indexes kept in sync by the add/remove methods, so
+        the list itself is not exposed for editing; edit `document.nodes`
+        and call `document.reindex_nodes()` instead.
+        """
+        return tuple(self._doc.nodes)
 
     @property
     def assumptions(self) -> List[Assumption]:
@@ -132,51 +159,36 @@ class Worksheet:
 
     def get_node(self, node_id: str) -> Optional[WorksheetNode]:
         """Get a node by ID."""
-        for node in self._doc.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self._doc.get_node(node_id)
 
     def find_given(self, symbol: str) -> Optional[GivenNode]:
         """Find a given node by symbol name."""
-        for node in self._doc.nodes:
-            if isinstance(node, GivenNode) and node.symbol == symbol:
-                return node
-        return None
+        return self._doc.find_given(symbol)
 
     def find_equation(self, lhs: str) -> Optional[EquationNode]:
         """Find an equation node by its left-hand side symbol."""
-        for node in self._doc.nodes:
-            if isinstance(node, EquationNode) and node.lhs == lhs:
-                return node
-        return None
+        return self._doc.find_equation(lhs)
 
     def find_result(self, symbol: str) -> Optional[ResultNode]:
         """Find the most recent result node for a symbol."""
-        for node in reversed(self._doc.nodes):
-            if isinstance(node, ResultNode) and node.symbol == symbol:
-                return node
-        return None
+        return self._doc.find_result(symbol)
 
     def get_givens(self) -> Dict[str, GivenNode]:
         """Get all given nodes as a symbol -> node dict."""
-        return {
-            node.symbol: node
-            for node in self._doc.nodes
-            if isinstance(node, GivenNode)
-        }
+        return {node.symbol: node for node in self._doc.givens}
 
     def get_equations(self) -> List[EquationNode]:
         """Get all equation nodes."""
-        return [n for n in self._doc.nodes if isinstance(n, EquationNode)]
+        return list(self._doc.equations)
 
     def get_results(self) -> Dict[str, ResultNode]:
         """Get all result nodes as a symbol -> node dict (latest per symbol)."""
-        results: Dict[str, ResultNode] = {}
-        for node in self._doc.nodes:
-            if isinstance(node, ResultNode):
-                results[node.symbol] = node
-        return results
+        return self._doc.latest_results()
+
+    def get_result_history(self, symbol: str, limit: Optional[int] = None) -> List[ResultNode]:
+        """Get result nodes for a symbol, oldest first (only the last `limit` if given)."""
+        history = self._doc.result_history(symbol)
+        return list(history[-limit:] if limit else history)
 
     # --- Node Mutation ---
 
@@ -199,11 +211,42 @@ class Worksheet:
             ),
             description=description,
         )
-        self._doc.nodes.append(node)
+        self._doc.append_node(node)
         self._record_history(f"Added given: {symbol}", "create", node)
         self._doc.updated_at = _now()
         return node
 
+    def add_givens_batch(
+        self, rows: Iterable[Tuple[str, float, Optional[str]]]
+    ) -> List[GivenNode]:
+        """Add many givens from (symbol, value, unit) rows in one pass.
+
+        The nodes share one timestamp and provenance, draw their ids from a
+        single random read, and are recorded as one history entry.
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+        provenance = make_user_provenance()
+        verification = Unverified()
+        nodes = [
+            GivenNode(
+                id=node_id,
+                provenance=provenance,
+                verification=verification,
+                symbol=symbol,
+                value=ValueWithUnit(
+                    value=value,
+                    unit=Unit(expression=unit) if unit else None,
+                ),
+            )
+            for node_id, (symbol, value, unit) in zip(_uuid_batch(len(rows)), rows)
+        ]
+        self._doc.extend_nodes(nodes)
+        self._record_history(f"Added {len(nodes)} givens", "create", *nodes)
+        self._doc.updated_at = provenance.timestamp
+        return nodes
+
     def set_given(self, symbol: str, value: float, unit: Optional[str] = None) -> GivenNode:
         """Set a given's value. Creates the given if it doesn't exist."""
         existing = self.find_given(symbol)
@@ -214,6 +257,7 @@ class Worksheet:
         if unit is not None:
             existing.value.unit = Unit(expression=unit)
         existing.verification = Unverified()
+        self._doc.clear_given_values()
         self._mark_dependents_stale(existing.id)
         self._doc.updated_at = _now()
         return existing
@@ -237,7 +281,7 @@ class Worksheet:
             rhs=rhs,
             is_definition=is_definition or None,
         )
-        self._doc.nodes.append(node)
+        self._doc.append_node(node)
         self._record_history(f"Added equation: {lhs} = {rhs}", "create", node)
         self._doc.updated_at = _now()
         return node
@@ -251,7 +295,7 @@ class Worksheet:
             content=content,
             format=fmt,
         )
-        self._doc.nodes.append(node)
+        self._doc.append_node(node)
         self._doc.updated_at = _now()
         return node
 
@@ -271,7 +315,7 @@ class Worksheet:
             description=description,
             applies_to=applies_to or [],
         )
-        self._doc.nodes.append(node)
+        self._doc.append_node(node)
         self._doc.updated_at = _now()
         return node
 
@@ -296,12 +340,10 @@ class Worksheet:
 
     def remove_node(self, node_id: str) -> bool:
         """Remove a node by ID."""
-        for i, node in enumerate(self._doc.nodes):
-            if node.id == node_id:
-                self._doc.nodes.pop(i)
-                self._doc.updated_at = _now()
-                return True
-        return False
+        if self._doc.remove_node(node_id) is None:
+            return False
+        self._doc.updated_at = _now()
+        return True
 
     # --- Compute Operations ---
 
@@ -317,21 +359,12 @@ class Worksheet:
         if self._auto_start:
             self._client.ensure_running()
 
-        # Collect equations and known variables (with unit metadata)
-        equations = []
-        variables: Dict[str, Any] = {}
-
-        for node in self._doc.nodes:
-            if isinstance(node, EquationNode):
-                equations.append(f"{node.lhs} = {node.rhs}")
-            elif isinstance(node, GivenNode):
-                if node.value.unit:
-                    variables[node.symbol] = {
-                        "value": node.value.value,
-                        "unit": node.value.unit.expression,
-                    }
-                else:
-                    variables[node.symbol] = node.value.value
+        # Equations and known variables (with unit metadata) come from the
+        # document's cached solver views; the equation ids double as provenance
+        doc = self._doc
+        equations = list(doc.solver_equations())
+        equation_ids = [node.id for node in doc.equations]
+        variables: Dict[str, Any] = dict(doc.solver_variables())
 
         if not equations:
             raise ValueError("No equations in worksheet to solve")
@@ -367,7 +400,7 @@ class Worksheet:
         # Create result node
         result_node = ResultNode(
             id=_uuid(),
-            provenance=make_computed_provenance([n.id for n in self._doc.nodes if isinstance(n, EquationNode)]),
+            provenance=make_computed_provenance(equation_ids),
             verification=Unverified(),
             symbol=target,
             value=ValueWithUnit(
@@ -379,7 +412,7 @@ class Worksheet:
             residual=None,
             solution_steps=steps if steps else None,
         )
-        self._doc.nodes.append(result_node)
+        self._doc.append_node(result_node)
         self._doc.updated_at = _now()
 
         return SolveResult(
@@ -397,11 +430,7 @@ class Worksheet:
             self._client.ensure_running()
 
         # Merge worksheet givens with explicit variables
-        all_vars = {
-            n.symbol: n.value.value
-            for n in self._doc.nodes
-            if isinstance(n, GivenNode)
-        }
+        all_vars = dict(self._doc.given_values())
         if variables:
             all_vars.update(variables)
 
@@ -419,51 +448,76 @@ class Worksheet:
         """Save the worksheet to a .worksheet file."""
         path = Path(path)
         self._doc.updated_at = _now()
-        data = self._doc.model_dump(by_alias=True, exclude_none=True)
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Serialize straight to JSON bytes in pydantic-core, skipping the
+        # intermediate dict that model_dump would build
+        path.write_bytes(
+            self._doc.model_dump_json(by_alias=True, exclude_none=True, indent=2).encode("utf-8")
+        )
         logger.info("Saved worksheet to %s", path)
 
     def export_json(self, path: Union[str, Path]) -> None:
         """Export the worksheet as formatted JSON."""
-        from .export import export_json
-        export_json(self._doc, path)
+        _load_export().export_json(self._doc, path)
 
     def export_csv(self, path: Union[str, Path]) -> None:
         """Export givens and results as CSV."""
-        from .export import export_csv
-        export_csv(self._doc, path)
+        _load_export().export_csv(self._doc, path)
 
     # --- History ---
 
-    def _record_history(self, description: str, change_type: str, node: WorksheetNode):
+    def _record_history(self, description: str, change_type: str, *nodes: WorksheetNode):
+        if not self._track_history:
+            return
         entry = HistoryEntry(
             id=_uuid(),
             timestamp=_now(),
             description=description,
-            changes=[NodeChange(
-                type=change_type,
-                node_id=node.id,
-                after=node.model_dump(by_alias=True, exclude_none=True) if change_type != "delete" else None,
-            )],
+            changes=[
+                NodeChange(
+                    type=change_type,
+                    node_id=node.id,
+                    after=node.model_dump(by_alias=True, exclude_none=True) if change_type != "delete" else None,
+                )
+                for node in nodes
+            ],
             source="user",
             parent_id=self._doc.current_history_id or None,
         )
-        self._doc.history.append(entry)
+        history = self._doc.history
+        history.append(entry)
         self._doc.current_history_id = entry.id
+        if self._history_limit is not None and len(history) > self._history_limit:
+            self._fold_history(len(history) - self._history_limit + 1)
+
+    def _fold_history(self, count: int):
+        """Replace the oldest `count` history entries with one checkpoint.
+
+        The checkpoint takes the id of the newest folded entry so the next
+        entry's parent_id still resolves; the folded node snapshots are dropped.
+        """
+        history = self._doc.history
+        last = history[count - 1]
+        history[:count] = [HistoryEntry(
+            id=last.id,
+            timestamp=last.timestamp,
+            description="Checkpoint (earlier history folded)",
+            changes=[],
+            source="engine",
+        )]
 
     def _mark_dependents_stale(self, node_id: str):
         """Mark all nodes that depend on node_id as stale (BFS)."""
-        visited = set()
-        queue = [node_id]
+        dependents_of = self._doc.dependents_of
+        # Ids are marked seen when enqueued, so each one is expanded at most once
+        seen = {node_id}
+        queue = deque([node_id])
         while queue:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
-            for node in self._doc.nodes:
-                if current in node.dependencies:
-                    node.is_stale = True
-                    queue.append(node.id)
+            for node in dependents_of(queue.popleft()):
+                node.is_stale = True
+                dep_id = node.id
+                if dep_id not in seen:
+                    seen.add(dep_id)
+                    queue.append(dep_id)
 
     # --- Context Manager ---
 
@@ -2,9 +2,13 @@
 Unit Registry - Dimensional analysis using Pint
 """
 
+import copy
 import logging
-from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, NamedTuple, Sequence, Tuple
 import re
+import tokenize
+import numpy as np
 import pint
 
 try:
@@ -15,6 +19,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 from pint import UnitRegistry as PintRegistry, DimensionalityError
 
+# Memo sizes for parsed unit strings; worksheets reuse a small set of units
+UNIT_PARSE_CACHE_SIZE = 1024
+UNIT_FORMAT_CACHE_SIZE = 512
+CLASSIFY_CACHE_SIZE = 1024
+ENGINEERING_DIMS_CACHE_SIZE = 2048
+VALIDATE_CACHE_SIZE = 512
+INFER_CACHE_SIZE = 256
+DIMS_FORMAT_CACHE_SIZE = 512
+
+# What Pint's unit/expression parser raises on malformed input: its own
+# PintError family, and the tokenizer's error for unbalanced brackets
+_PARSE_ERRORS = (pint.errors.PintError, tokenize.TokenError)
+
 
 # SI Derived Units mapped by dimensionality
 # Format: {(mass, length, time, current, temperature, amount, luminosity): (name, symbol)}
@@ -40,11 +57,114 @@ SI_DERIVED_UNITS = {
 }
 
 
+# Pint dimension keys in SI_DERIVED_UNITS / DOMAIN_TAXONOMY tuple order:
+# mass, length, time, current, temperature, amount, luminosity
+_DIM_KEYS = ("[mass]", "[length]", "[time]", "[current]", "[temperature]", "[substance]", "[luminosity]")
+
+
+class Dims7(NamedTuple):
+    """Base-dimension exponents in _DIM_KEYS order; compares equal to the plain 7-tuple."""
+    mass: int = 0
+    length: int = 0
+    time: int = 0
+    current: int = 0
+    temperature: int = 0
+    substance: int = 0
+    luminosity: int = 0
+
+    @classmethod
+    def from_dims(cls, dims) -> "Dims7":
+        """From a Pint-style {"[mass]": 1, ...} mapping; exponents are kept as given."""
+        return cls._make([dims.get(key, 0) for key in _DIM_KEYS])
+
+# Dimension exponents packed into one int, one 8-bit lane per _DIM_KEYS slot
+# biased by 127, so lookups hash/compare a single int. Fractional or
+# out-of-range exponents get the 0xFF lane, which no integer exponent uses.
+_DIM_LANE_BITS = 8
+_DIM_LANE_BIAS = 127
+_DIM_LANE_INVALID = 0xFF
+
+
+def _pack_exponents(exponents) -> int:
+    """Pack exponents given in _DIM_KEYS order into a single int."""
+    packed = 0
+    shift = 0
+    for exp in exponents:
+        if exp == int(exp) and -_DIM_LANE_BIAS <= exp <= _DIM_LANE_BIAS:
+            lane = int(exp) + _DIM_LANE_BIAS
+        else:
+            lane = _DIM_LANE_INVALID
+        packed |= lane << shift
+        shift += _DIM_LANE_BITS
+    return packed
+
+
+def _pack_dims(dims) -> int:
+    """Pack a Pint-style {"[mass]": 1, ...} dimension mapping into a single int."""
+    return _pack_exponents(dims.get(key, 0) for key in _DIM_KEYS)
+
+
+def _dim_pattern(**exponents: int) -> Tuple[int, int]:
+    """(mask, value) matching only the named dimensions, e.g. mass=1, time=-2."""
+    mask = value = 0
+    for name, exp in exponents.items():
+        shift = _DIM_KEYS.index(f"[{name}]") * _DIM_LANE_BITS
+        mask |= 0xFF << shift
+        value |= (exp + _DIM_LANE_BIAS) << shift
+    return mask, value
+
+
+_DIMENSIONLESS_PACKED = _pack_exponents((0,) * len(_DIM_KEYS))
+
+# SI base unit abbreviations, applied in one regex pass
+_BASE_UNIT_ABBREVIATIONS = {
+    'meter': 'm',
+    'kilogram': 'kg',
+    'second': 's',
+    'ampere': 'A',
+    'kelvin': 'K',
+    'mole': 'mol',
+    'candela': 'cd',
+    'radian': 'rad',
+}
+_ABBREV_RE = re.compile('|'.join(map(re.escape, _BASE_UNIT_ABBREVIATIONS)))
+_EXP_RE = re.compile(r' \*\* (-?\d+)')
+_SUPERSCRIPTS = str.maketrans('0123456789-', '⁰¹²³⁴⁵⁶⁷⁸⁹⁻')
+
+
+@lru_cache(maxsize=UNIT_FORMAT_CACHE_SIZE)
+def _format_base_unit(unit_str: str) -> str:
+    """
+    Format a Pint base unit string to a cleaner representation.
+
+    Converts:
+      - "meter ** 2" -> "m²"
+      - "kilogram * meter / second ** 2" -> "kg·m/s²"
+      - "meter" -> "m"
+    """
+    # Replace full names with abbreviations
+    result = _ABBREV_RE.sub(lambda m: _BASE_UNIT_ABBREVIATIONS[m.group(0)], unit_str)
+
+    # Convert " ** N" to superscript
+    result = _EXP_RE.sub(lambda m: m.group(1).translate(_SUPERSCRIPTS), result)
+
+    # Clean up multiplication and division
+    result = result.replace(' * ', '·')
+    result = result.replace(' / ', '/')
+
+    return result
+
+
 class UnitRegistry:
     """
     Unit registry for dimensional analysis.
 
     Wraps Pint to provide unit checking and conversion for engineering calculations.
+
+    One instance is shared by the event loop and the worker threads in main.py.
+    Pint is pure Python, so per-thread registries would not run in parallel
+    under the GIL; they would also split the memo caches below, and Pint
+    refuses to mix quantities from different registries.
     """
 
     def __init__(self):
@@ -54,6 +174,39 @@ class UnitRegistry:
         # Define any custom units
         self._define_custom_units()
 
+        # Pint's parser is pure Python; memoize it per registry. Callers only
+        # read the returned units/quantities, never mutate them.
+        self._parse_units_cached = lru_cache(maxsize=UNIT_PARSE_CACHE_SIZE)(self.ureg.parse_units)
+        self._parse_expression_cached = lru_cache(maxsize=UNIT_PARSE_CACHE_SIZE)(
+            self.ureg.parse_expression
+        )
+        # SI derived (name, symbol) keyed by Pint's own dimensionality items,
+        # so lookups hash the parsed container directly. Fractional exponents
+        # have no entry and miss naturally.
+        self._derived_by_dim: Dict[frozenset, Tuple[str, str]] = {}
+        # Base-unit string and base->derived scale per derived unit name, plus
+        # the unit strings that already *are* a derived unit (its name or a
+        # symbol Pint reads as that same unit) for the simplify fast path.
+        self._derived_raw_unit: Dict[str, str] = {}
+        self._derived_scale: Dict[str, float] = {}
+        self._derived_by_unit: Dict[str, Tuple[str, str]] = {}
+        for name, symbol in SI_DERIVED_UNITS.values():
+            parsed = self.ureg.parse_units(name)
+            self._derived_by_dim[frozenset(parsed.dimensionality.items())] = (name, symbol)
+            base = self.Q_(1, name).to_base_units()
+            self._derived_raw_unit[name] = str(base.units)
+            # Round-trip factor keeps Pint's int/float magnitude type for display
+            self._derived_scale[name] = base.to(name).magnitude
+            self._derived_by_unit[name] = (name, symbol)
+            try:
+                if self.ureg.parse_units(symbol) == parsed:
+                    self._derived_by_unit[symbol] = (name, symbol)
+            except (pint.UndefinedUnitError, ValueError):
+                pass
+        self._summarize_expression_cached = lru_cache(maxsize=UNIT_PARSE_CACHE_SIZE)(
+            self._summarize_expression
+        )
+
     def _define_custom_units(self):
         """Define custom units not in standard Pint."""
         # Example custom definitions
@@ -61,51 +214,13 @@ class UnitRegistry:
         pass
 
     def _format_base_unit(self, unit_str: str) -> str:
-        """
-        Format a Pint base unit string to a cleaner representation.
+        return _format_base_unit(unit_str)
 
-        Converts:
-          - "meter ** 2" -> "m²"
-          - "kilogram * meter / second ** 2" -> "kg·m/s²"
-          - "meter" -> "m"
-        """
-        # Superscript mapping for exponents
-        superscripts = {
-            '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
-            '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
-            '-': '⁻'
-        }
-
-        # SI base unit abbreviations
-        abbreviations = {
-            'meter': 'm',
-            'kilogram': 'kg',
-            'second': 's',
-            'ampere': 'A',
-            'kelvin': 'K',
-            'mole': 'mol',
-            'candela': 'cd',
-            'radian': 'rad',
-        }
-
-        result = unit_str
-
-        # Replace full names with abbreviations
-        for full, abbrev in abbreviations.items():
-            result = result.replace(full, abbrev)
-
-        # Convert " ** N" to superscript
-        def replace_exp(match):
-            exp = match.group(1)
-            return ''.join(superscripts.get(c, c) for c in exp)
-
-        result = re.sub(r' \*\* (-?\d+)', replace_exp, result)
-
-        # Clean up multiplication and division
-        result = result.replace(' * ', '·')
-        result = result.replace(' / ', '/')
-
-        return result
+    def clear_caches(self) -> None:
+        """Drop memoized parses, e.g. after defining new units on `ureg`."""
+        self._parse_units_cached.cache_clear()
+        self._parse_expression_cached.cache_clear()
+        self._summarize_expression_cached.cache_clear()
 
     def check_units(self, expression: str, expected_unit: Optional[str] = None) -> Dict:
         """
@@ -120,37 +235,13 @@ class UnitRegistry:
         """
         logger.debug("check_units called with: '%s'", expression)
         try:
-            # Parse the expression
-            result = self.ureg.parse_expression(expression)
-            logger.debug("Parsed result: %s, units: %s, dims: %s", result, result.units, result.dimensionality)
-
-            # Get dimensionality
-            dims = str(result.dimensionality)
-
-            # Get SI base units
-            si_base = None
-            si_result = None
-            try:
-                si_result = result.to_base_units()
-                si_base = f"{si_result.magnitude} {si_result.units}"
-                logger.debug("Base units: %s", si_result.units)
-            except Exception as e:
-                # Log the error but continue - we'll use the original units
-                logger.debug("to_base_units failed for %s: %s", expression, e)
-
-            # Get simplified unit string from base units
-            # e.g., "newton / pascal" -> "meter ** 2" -> "m²"
-            simplified_unit = str(result.units)
-            logger.debug("Initial simplified_unit: %s", simplified_unit)
-            if si_result is not None:
-                # Use the SI base unit representation (properly reduced)
-                simplified_unit = self._format_base_unit(str(si_result.units))
-                logger.debug("Final simplified_unit (formatted): %s", simplified_unit)
+            # Parse and stringify once per distinct expression
+            result, dims, si_base, simplified_unit = self._summarize_expression_cached(expression)
 
             # Check against expected
             if expected_unit:
                 try:
-                    expected = self.ureg.parse_units(expected_unit)
+                    expected = self._parse_units_cached(expected_unit)
                     consistent = result.dimensionality == expected.dimensionality
 
                     if not consistent:
@@ -184,6 +275,35 @@ class UnitRegistry:
                 "error": f"Unit parsing error: {e}",
             }
 
+    def _summarize_expression(self, expression: str) -> Tuple[Any, str, Optional[str], str]:
+        """Parsed quantity plus its dimensionality, SI base and simplified unit strings."""
+        result = self._parse_expression_cached(expression)
+        logger.debug("Parsed result: %s, units: %s, dims: %s", result, result.units, result.dimensionality)
+
+        # Get dimensionality
+        dims = str(result.dimensionality)
+
+        # Get SI base units
+        si_base = None
+        si_result = None
+        try:
+            si_result = result.to_base_units()
+            si_base = f"{si_result.magnitude} {si_result.units}"
+            logger.debug("Base units: %s", si_result.units)
+        except Exception as e:
+            # Log the error but continue - we'll use the original units
+            logger.debug("to_base_units failed for %s: %s", expression, e)
+
+        # Get simplified unit string from base units
+        # e.g., "newton / pascal" -> "meter ** 2" -> "m²"
+        simplified_unit = str(result.units)
+        if si_result is not None:
+            # Use the SI base unit representation (properly reduced)
+            simplified_unit = self._format_base_unit(str(si_result.units))
+        logger.debug("Simplified unit: %s", simplified_unit)
+
+        return result, dims, si_base, simplified_unit
+
     def convert(self, value: float, from_unit: str, to_unit: str) -> float:
         """
         Convert a value from one unit to another.
@@ -210,7 +330,7 @@ class UnitRegistry:
         Returns:
             Dict mapping dimension names to powers
         """
-        parsed = self.ureg.parse_units(unit)
+        parsed = self._parse_units_cached(unit)
         dims = parsed.dimensionality
 
         # Convert to simple dict
@@ -219,8 +339,8 @@ class UnitRegistry:
     def are_compatible(self, unit1: str, unit2: str) -> bool:
         """Check if two units are dimensionally compatible."""
         try:
-            u1 = self.ureg.parse_units(unit1)
-            u2 = self.ureg.parse_units(unit2)
+            u1 = self._parse_units_cached(unit1)
+            u2 = self._parse_units_cached(unit2)
             return u1.dimensionality == u2.dimensionality
         except (pint.UndefinedUnitError, ValueError, TypeError) as e:
             logger.debug("are_compatible failed for '%s' vs '%s': %s", unit1, unit2, e)
@@ -234,7 +354,7 @@ class UnitRegistry:
 
     def simplify_unit(self, unit: str) -> str:
         """Simplify a compound unit expression."""
-        parsed = self.ureg.parse_units(unit)
+        parsed = self._parse_units_cached(unit)
         # Try to reduce to a simpler form
         try:
             reduced = parsed.to_reduced_units()
@@ -243,27 +363,29 @@ class UnitRegistry:
             logger.debug("simplify_unit reduction failed for '%s': %s", unit, e)
             return str(parsed)
 
-    def _get_dimensionality_tuple(self, dims: dict) -> Optional[Tuple[int, ...]]:
+    def _get_dimensionality_tuple(self, dims: dict) -> Optional[Dims7]:
         """Convert Pint dimensionality dict to a tuple for lookup.
 
         Returns None if any dimension has a fractional exponent (e.g., m^0.5),
         since those can't be matched against the integer-keyed taxonomy.
         """
-        # Order: mass, length, time, current, temperature, amount, luminosity
-        raw = (
-            dims.get("[mass]", 0),
-            dims.get("[length]", 0),
-            dims.get("[time]", 0),
-            dims.get("[current]", 0),
-            dims.get("[temperature]", 0),
-            dims.get("[substance]", 0),
-            dims.get("[luminosity]", 0),
-        )
+        raw = Dims7.from_dims(dims)
         # Check for fractional exponents before truncating
         for val in raw:
             if float(val) != int(val):
                 return None
-        return tuple(int(v) for v in raw)
+        return Dims7._make([int(v) for v in raw])
+
+    def get_dim_tuple(self, unit: str) -> Optional[Dims7]:
+        """
+        Exponents of `unit` in _DIM_KEYS order (mass, length, time, current,
+        temperature, substance, luminosity), or None if any is fractional.
+        """
+        return self._get_dimensionality_tuple(self._parse_units_cached(unit).dimensionality)
+
+    def _derived_for_dimensionality(self, dimensionality) -> Optional[Tuple[str, str]]:
+        """SI derived (name, symbol) with this Pint dimensionality, if any."""
+        return self._derived_by_dim.get(frozenset(dimensionality.items()))
 
     def simplify_to_derived(self, value: float, unit: str) -> Dict[str, Any]:
         """
@@ -282,27 +404,42 @@ class UnitRegistry:
                 - display: formatted display string
         """
         try:
+            # Already a derived unit: no Pint conversion needed
+            derived_unit = self._derived_by_unit.get(unit)
+            if derived_unit is not None:
+                name, symbol = derived_unit
+                magnitude = value * self._derived_scale[name]
+                return {
+                    "value": float(magnitude),
+                    "raw_unit": self._derived_raw_unit[name],
+                    "simplified_unit": name,
+                    "symbol": symbol,
+                    "display": f"{magnitude} {symbol}",
+                    "has_derived": True,
+                }
+
             quantity = self.Q_(value, unit)
 
             # Convert to base SI units first
             base = quantity.to_base_units()
             raw_unit = str(base.units)
 
-            # Get dimensionality tuple
-            dims = dict(base.dimensionality)
-            dim_tuple = self._get_dimensionality_tuple(dims)
-
-            # Look up in SI derived units
-            if dim_tuple in SI_DERIVED_UNITS:
-                name, symbol = SI_DERIVED_UNITS[dim_tuple]
-                # Convert to the derived unit
-                derived = base.to(name)
+            # Look up in SI derived units by the already-reduced dimensions
+            derived_unit = self._derived_for_dimensionality(base.dimensionality)
+            if derived_unit is not None:
+                name, symbol = derived_unit
+                # Coherent SI units scale by exactly 1 from base units
+                scale = self._derived_scale[name]
+                if scale == 1:
+                    magnitude = base.magnitude * scale
+                else:
+                    magnitude = base.to(name).magnitude
                 return {
-                    "value": float(derived.magnitude),
+                    "value": float(magnitude),
                     "raw_unit": raw_unit,
                     "simplified_unit": name,
                     "symbol": symbol,
-                    "display": f"{derived.magnitude} {symbol}",
+                    "display": f"{magnitude} {symbol}",
                     "has_derived": True,
                 }
 
@@ -326,6 +463,58 @@ class UnitRegistry:
                 "error": str(e),
             }
 
+    def simplify_to_derived_batch(
+        self, values: Sequence[float], units: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        simplify_to_derived over many (value, unit) pairs.
+
+        Values are grouped by unit string and each group goes through one
+        array-valued Pint conversion, so parsing, base-unit reduction and the
+        derived-unit lookup run once per distinct unit rather than per value.
+        Values are converted as floats.
+
+        Returns:
+            One simplify_to_derived-style dict per input pair, in input order
+        """
+        if len(values) != len(units):
+            raise ValueError("values and units must have the same length")
+
+        groups: Dict[str, List[int]] = {}
+        for i, unit in enumerate(units):
+            groups.setdefault(unit, []).append(i)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(values)
+        for unit, indices in groups.items():
+            try:
+                base = self.Q_(np.asarray([values[i] for i in indices], dtype=float), unit).to_base_units()
+                raw_unit = str(base.units)
+                derived_unit = self._derived_for_dimensionality(base.dimensionality)
+                if derived_unit is None:
+                    name, symbol, label = None, None, raw_unit
+                    magnitudes = base.magnitude
+                else:
+                    name, symbol = derived_unit
+                    label = symbol
+                    scale = self._derived_scale[name]
+                    magnitudes = base.magnitude * scale if scale == 1 else base.to(name).magnitude
+            except Exception:
+                # Let each value report its own error dict
+                for i in indices:
+                    results[i] = self.simplify_to_derived(values[i], unit)
+                continue
+
+            for i, magnitude in zip(indices, magnitudes.tolist()):
+                results[i] = {
+                    "value": magnitude,
+                    "raw_unit": raw_unit,
+                    "simplified_unit": name,
+                    "symbol": symbol,
+                    "display": f"{magnitude} {label}",
+                    "has_derived": derived_unit is not None,
+                }
+        return results
+
     def format_result(
         self,
         value: float,
@@ -418,6 +607,9 @@ DOMAIN_TAXONOMY = {
     (0, -2, 0, 0, 0, 0, 1): ("optics", "illuminance", "☀️"),
 }
 
+# DOMAIN_TAXONOMY keyed by packed exponents (see _pack_exponents)
+_DOMAIN_TAXONOMY_PACKED = {_pack_exponents(k): v for k, v in DOMAIN_TAXONOMY.items()}
+
 # Domain metadata for display
 DOMAIN_INFO = {
     "mechanics": {"label": "Mechanics", "color": "#3b82f6", "icon": "⚙️"},
@@ -431,6 +623,23 @@ DOMAIN_INFO = {
 }
 
 
+# classify() falls back to "unknown" for fractional exponents and to
+# "dimensionless" otherwise
+_UNKNOWN_DOMAIN_INFO = DOMAIN_INFO["unknown"]
+_DIMENSIONLESS_DOMAIN_INFO = DOMAIN_INFO["dimensionless"]
+
+# Unit strings classify() answers without parsing (compared after strip())
+_TRIVIAL_DIMENSIONLESS = frozenset({"", "1", "dimensionless", "rad", "sr", "radian", "steradian"})
+
+_DIMENSIONLESS_RESULT = {
+    "domain": "dimensionless",
+    "quantity": "ratio",
+    "icon": "∅",
+    "domain_info": DOMAIN_INFO["dimensionless"],
+    "dimensions": {},
+}
+
+
 class PhysicalDomainClassifier:
     """
     Classifies physical quantities by their domain based on dimensions.
@@ -442,7 +651,12 @@ class PhysicalDomainClassifier:
     def __init__(self, registry: 'UnitRegistry'):
         self.registry = registry
         self.ureg = registry.ureg
+        # Sessions classify the same handful of units over and over
+        self._classify_cached = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(self._classify)
 
+    def clear_caches(self) -> None:
+        """Drop memoized classifications, e.g. after defining new units on `ureg`."""
+        self._classify_cached.cache_clear()
 
     def classify(self, unit: str) -> Dict[str, Any]:
         """
@@ -459,54 +673,78 @@ class PhysicalDomainClassifier:
                 - domain_info: Full domain metadata (label, color, icon)
                 - dimensions: Raw dimension dict
         """
+        if isinstance(unit, str) and unit.strip() in _TRIVIAL_DIMENSIONLESS:
+            # Common UI inputs that are dimensionless by definition; no parse needed
+            return {**_DIMENSIONLESS_RESULT, "dimensions": {}}
+        result = self._classify_cached(unit)
+        # Callers get their own dicts; the cached entry stays untouched
+        return {**result, "dimensions": dict(result["dimensions"])}
+
+    def classify_many(self, units: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Classify a list of units, e.g. for a UI listing many values.
+
+        Each distinct unit is classified once; repeated units share the same
+        result dict, so treat the results as read-only.
+        """
+        classify = self.classify
         try:
-            parsed = self.ureg.parse_units(unit)
-            dims = dict(parsed.dimensionality)
-            dim_tuple = self.registry._get_dimensionality_tuple(dims)
+            unique = dict.fromkeys(units)
+        except TypeError:
+            # Unhashable entries can't be deduplicated
+            return [classify(unit) for unit in units]
+        for unit in unique:
+            unique[unit] = classify(unit)
+        return [unique[unit] for unit in units]
+
+    def _classify(self, unit: str) -> Dict[str, Any]:
+        try:
+            parsed = self.registry._parse_units_cached(unit)
+            # Read the Pint container directly; a dict copy is only made for
+            # results that report dimensions
+            dimensionality = parsed.dimensionality
+            dim_tuple = self.registry._get_dimensionality_tuple(dimensionality)
 
             # Fractional exponents can't be matched against taxonomy
             if dim_tuple is None:
-                domain = self._infer_domain_from_dims(dims)
+                domain = self._infer_domain_from_dims(Dims7.from_dims(dimensionality))
                 return {
                     "domain": domain,
                     "quantity": "fractional_compound",
-                    "icon": DOMAIN_INFO.get(domain, DOMAIN_INFO["unknown"])["icon"],
-                    "domain_info": DOMAIN_INFO.get(domain, DOMAIN_INFO["unknown"]),
-                    "dimensions": dims,
+                    "icon": DOMAIN_INFO.get(domain, _UNKNOWN_DOMAIN_INFO)["icon"],
+                    "domain_info": DOMAIN_INFO.get(domain, _UNKNOWN_DOMAIN_INFO),
+                    "dimensions": dict(dimensionality),
                 }
 
+            packed = _pack_exponents(dim_tuple)
+
             # Check if dimensionless
-            if dim_tuple == (0, 0, 0, 0, 0, 0, 0):
-                return {
-                    "domain": "dimensionless",
-                    "quantity": "ratio",
-                    "icon": "∅",
-                    "domain_info": DOMAIN_INFO["dimensionless"],
-                    "dimensions": {},
-                }
+            if packed == _DIMENSIONLESS_PACKED:
+                return {**_DIMENSIONLESS_RESULT, "dimensions": {}}
 
             # Look up in taxonomy
-            if dim_tuple in DOMAIN_TAXONOMY:
-                domain, quantity, icon = DOMAIN_TAXONOMY[dim_tuple]
+            entry = _DOMAIN_TAXONOMY_PACKED.get(packed)
+            if entry is not None:
+                domain, quantity, icon = entry
                 return {
                     "domain": domain,
                     "quantity": quantity,
                     "icon": icon,
-                    "domain_info": DOMAIN_INFO.get(domain, DOMAIN_INFO["dimensionless"]),
-                    "dimensions": dims,
+                    "domain_info": DOMAIN_INFO.get(domain, _DIMENSIONLESS_DOMAIN_INFO),
+                    "dimensions": dict(dimensionality),
                 }
 
             # Try to infer domain from dimension components
-            domain = self._infer_domain_from_dims(dims)
+            domain = self._infer_domain_from_dims(dim_tuple)
             return {
                 "domain": domain,
                 "quantity": "compound",
-                "icon": DOMAIN_INFO.get(domain, DOMAIN_INFO["dimensionless"])["icon"],
-                "domain_info": DOMAIN_INFO.get(domain, DOMAIN_INFO["dimensionless"]),
-                "dimensions": dims,
+                "icon": DOMAIN_INFO.get(domain, _DIMENSIONLESS_DOMAIN_INFO)["icon"],
+                "domain_info": DOMAIN_INFO.get(domain, _DIMENSIONLESS_DOMAIN_INFO),
+                "dimensions": dict(dimensionality),
             }
 
-        except Exception as e:
+        except _PARSE_ERRORS as e:
             return {
                 "domain": "unknown",
                 "quantity": "unknown",
@@ -516,22 +754,22 @@ class PhysicalDomainClassifier:
                 "error": str(e),
             }
 
-    def _infer_domain_from_dims(self, dims: dict) -> str:
+    def _infer_domain_from_dims(self, dims: Dims7) -> str:
         """Infer domain from dimension components when not in taxonomy."""
         # Check for electrical (has current)
-        if dims.get("[current]", 0) != 0:
+        if dims.current != 0:
             return "electrical"
 
         # Check for thermal (has temperature, no current)
-        if dims.get("[temperature]", 0) != 0:
+        if dims.temperature != 0:
             return "thermodynamics"
 
         # Check for chemistry (has substance/amount)
-        if dims.get("[substance]", 0) != 0:
+        if dims.substance != 0:
             return "chemistry"
 
         # Check for optics (has luminosity)
-        if dims.get("[luminosity]", 0) != 0:
+        if dims.luminosity != 0:
             return "optics"
 
         # Default to mechanics
@@ -543,45 +781,163 @@ class PhysicalDomainClassifier:
 
 
 # Dimension checking utilities for specific domains
+# (mask, value) patterns; dimensions not named are not checked
+_FORCE_DIMS = _dim_pattern(mass=1, length=1, time=-2)         # mass * length / time^2
+_STRESS_DIMS = _dim_pattern(mass=1, length=-1, time=-2)       # force / area
+_ENERGY_DIMS = _dim_pattern(mass=1, length=2, time=-2)        # mass * length^2 / time^2
+_POWER_DIMS = _dim_pattern(mass=1, length=2, time=-3)         # energy / time
+_VELOCITY_DIMS = _dim_pattern(length=1, time=-1)
+_ACCELERATION_DIMS = _dim_pattern(length=1, time=-2)
+
+_ENGINEERING_CATEGORIES = (
+    ("force", _FORCE_DIMS),
+    ("stress", _STRESS_DIMS),
+    ("energy", _ENERGY_DIMS),
+    ("power", _POWER_DIMS),
+    ("velocity", _VELOCITY_DIMS),
+    ("acceleration", _ACCELERATION_DIMS),
+)
+
+
 class EngineeringUnits:
     """Common engineering unit checks."""
 
     def __init__(self, registry: UnitRegistry):
         self.registry = registry
+        # Packed dimensions per unit string, so asking several predicates
+        # about the same unit parses it once
+        self._packed_dims = lru_cache(maxsize=ENGINEERING_DIMS_CACHE_SIZE)(self._lookup_packed_dims)
+
+    def clear_caches(self) -> None:
+        """Drop memoized dimensions, e.g. after defining new units on `ureg`."""
+        self._packed_dims.cache_clear()
+
+    def _lookup_packed_dims(self, unit: str) -> Optional[int]:
+        dim_tuple = self.registry.get_dim_tuple(unit)
+        # Fractional exponents never match any category
+        return None if dim_tuple is None else _pack_exponents(dim_tuple)
+
+    def _matches(self, unit: str, pattern: Tuple[int, int]) -> bool:
+        packed = self._packed_dims(unit)
+        if packed is None:
+            return False
+        mask, value = pattern
+        return packed & mask == value
+
+    def classify_all(self, unit: str) -> Dict[str, bool]:
+        """
+        Run every check at once.
+
+        Returns:
+            {"force": bool, "stress": bool, "energy": bool, "power": bool,
+             "velocity": bool, "acceleration": bool}
+        """
+        packed = self._packed_dims(unit)
+        return {
+            name: packed is not None and packed & mask == value
+            for name, (mask, value) in _ENGINEERING_CATEGORIES
+        }
 
     def is_force(self, unit: str) -> bool:
         """Check if unit represents force."""
-        dims = self.registry.get_dimensions(unit)
-        # Force = mass * length / time^2
-        return dims.get("[mass]", 0) == 1 and dims.get("[length]", 0) == 1 and dims.get("[time]", 0) == -2
+        return self._matches(unit, _FORCE_DIMS)
 
     def is_stress(self, unit: str) -> bool:
         """Check if unit represents stress/pressure."""
-        dims = self.registry.get_dimensions(unit)
-        # Stress = force / area = mass / (length * time^2)
-        return dims.get("[mass]", 0) == 1 and dims.get("[length]", 0) == -1 and dims.get("[time]", 0) == -2
+        return self._matches(unit, _STRESS_DIMS)
 
     def is_energy(self, unit: str) -> bool:
         """Check if unit represents energy."""
-        dims = self.registry.get_dimensions(unit)
-        # Energy = mass * length^2 / time^2
-        return dims.get("[mass]", 0) == 1 and dims.get("[length]", 0) == 2 and dims.get("[time]", 0) == -2
+        return self._matches(unit, _ENERGY_DIMS)
 
     def is_power(self, unit: str) -> bool:
         """Check if unit represents power."""
-        dims = self.registry.get_dimensions(unit)
-        # Power = energy / time = mass * length^2 / time^3
-        return dims.get("[mass]", 0) == 1 and dims.get("[length]", 0) == 2 and dims.get("[time]", 0) == -3
+        return self._matches(unit, _POWER_DIMS)
 
     def is_velocity(self, unit: str) -> bool:
         """Check if unit represents velocity."""
-        dims = self.registry.get_dimensions(unit)
-        return dims.get("[length]", 0) == 1 and dims.get("[time]", 0) == -1
+        return self._matches(unit, _VELOCITY_DIMS)
 
     def is_acceleration(self, unit: str) -> bool:
         """Check if unit represents acceleration."""
-        dims = self.registry.get_dimensions(unit)
-        return dims.get("[length]", 0) == 1 and dims.get("[time]", 0) == -2
+        return self._matches(unit, _ACCELERATION_DIMS)
+
+
+# Common physical quantity names, keyed by packed exponents (see _pack_exponents)
+_QUANTITY_NAMES = {
+    _pack_dims(dims): name for dims, name in (
+        # Base quantities
+        ({"[mass]": 1}, "mass"),
+        ({"[length]": 1}, "length"),
+        ({"[time]": 1}, "time"),
+        ({"[temperature]": 1}, "temperature"),
+        ({"[current]": 1}, "current"),
+        # Derived quantities
+        ({"[length]": 2}, "area"),
+        ({"[length]": 3}, "volume"),
+        ({"[length]": 1, "[time]": -1}, "velocity"),
+        ({"[length]": 1, "[time]": -2}, "acceleration"),
+        ({"[mass]": 1, "[length]": 1, "[time]": -2}, "force"),
+        ({"[mass]": 1, "[length]": -1, "[time]": -2}, "pressure/stress"),
+        ({"[mass]": 1, "[length]": 2, "[time]": -2}, "energy/work"),
+        ({"[mass]": 1, "[length]": 2, "[time]": -3}, "power"),
+        ({"[mass]": 1, "[length]": 2, "[time]": -3, "[current]": -1}, "voltage"),
+        ({"[mass]": 1, "[length]": 2, "[time]": -3, "[current]": -2}, "resistance"),
+    )
+}
+
+
+# Identifiers in equations that are functions/constants, not variables
+_MATH_BUILTINS = frozenset({
+    'pi', 'e', 'sin', 'cos', 'tan', 'asin', 'acos', 'atan',
+    'sqrt', 'log', 'ln', 'exp', 'abs', 'Abs',
+})
+
+_IDENTIFIER = r'[A-Za-z_]\w*'
+
+# SI base unit for each base dimension
+_DIM_TO_UNIT = {
+    "[mass]": "kg",
+    "[length]": "m",
+    "[time]": "s",
+    "[temperature]": "K",
+    "[current]": "A",
+    "[substance]": "mol",
+    "[luminosity]": "cd"
+}
+
+
+# Pint dimensionality containers are immutable and hashable, so the
+# conversions below can be keyed on them directly
+@lru_cache(maxsize=DIMS_FORMAT_CACHE_SIZE)
+def _dimensionality_to_dict(dimensionality) -> Dict[str, int]:
+    """Nonzero dimensions of a Pint dimensionality; callers must copy before mutating."""
+    return {str(k): int(v) for k, v in dict(dimensionality).items() if v != 0}
+
+
+@lru_cache(maxsize=DIMS_FORMAT_CACHE_SIZE)
+def _format_dims(items: frozenset) -> str:
+    """Readable form of nonempty dimension items, e.g. "length × time^-2"."""
+    parts = []
+    for dim, power in sorted(items):
+        dim_name = dim.replace("[", "").replace("]", "")
+        if power == 1:
+            parts.append(dim_name)
+        else:
+            parts.append(f"{dim_name}^{power}")
+    return " × ".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _substitution_pattern(names: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    One regex for a variable-name signature: group 1 is one of `names` as a
+    whole word, group 2 any other identifier token.
+    """
+    if names:
+        alternation = "|".join(map(re.escape, names))
+        return re.compile(rf'\b(?:({alternation})|({_IDENTIFIER}))\b')
+    return re.compile(rf'\b()?({_IDENTIFIER})\b')
 
 
 class EquationUnitValidator:
@@ -596,54 +952,34 @@ class EquationUnitValidator:
         self.registry = registry
         self.ureg = registry.ureg
         self.Q_ = registry.Q_
+        # Solver loops and UI re-renders validate the same equation with the
+        # same variables over and over; keyed by _validation_key
+        self._validate_cached = lru_cache(maxsize=VALIDATE_CACHE_SIZE)(self._validate_from_key)
+        self._infer_cached = lru_cache(maxsize=INFER_CACHE_SIZE)(self._infer_from_signature)
+
+    def clear_caches(self) -> None:
+        """Drop memoized validations, e.g. after defining new units on `ureg`."""
+        self._validate_cached.cache_clear()
+        self._infer_cached.cache_clear()
 
     def _dims_to_dict(self, dimensionality) -> Dict[str, int]:
         """Convert Pint dimensionality to a clean dict."""
-        return {str(k): int(v) for k, v in dict(dimensionality).items() if v != 0}
+        return dict(_dimensionality_to_dict(dimensionality))
 
     def _dims_to_str(self, dims: Dict[str, int]) -> str:
         """Format dimensions as a readable string."""
         if not dims:
             return "dimensionless"
-        parts = []
-        for dim, power in sorted(dims.items()):
-            dim_name = dim.replace("[", "").replace("]", "")
-            if power == 1:
-                parts.append(dim_name)
-            else:
-                parts.append(f"{dim_name}^{power}")
-        return " × ".join(parts)
+        return _format_dims(frozenset(dims.items()))
 
     def _get_common_quantity_name(self, dims: Dict[str, int]) -> Optional[str]:
         """Map dimensions to common physical quantity names."""
-        # Normalize keys to [dimension] format
-        normalized = {}
-        for k, v in dims.items():
-            key = k if k.startswith("[") else f"[{k}]"
-            normalized[key] = v
-
-        quantity_map = {
-            # Base quantities
-            frozenset({("[mass]", 1)}): "mass",
-            frozenset({("[length]", 1)}): "length",
-            frozenset({("[time]", 1)}): "time",
-            frozenset({("[temperature]", 1)}): "temperature",
-            frozenset({("[current]", 1)}): "current",
-            # Derived quantities
-            frozenset({("[length]", 2)}): "area",
-            frozenset({("[length]", 3)}): "volume",
-            frozenset({("[length]", 1), ("[time]", -1)}): "velocity",
-            frozenset({("[length]", 1), ("[time]", -2)}): "acceleration",
-            frozenset({("[mass]", 1), ("[length]", 1), ("[time]", -2)}): "force",
-            frozenset({("[mass]", 1), ("[length]", -1), ("[time]", -2)}): "pressure/stress",
-            frozenset({("[mass]", 1), ("[length]", 2), ("[time]", -2)}): "energy/work",
-            frozenset({("[mass]", 1), ("[length]", 2), ("[time]", -3)}): "power",
-            frozenset({("[mass]", 1), ("[length]", 2), ("[time]", -3), ("[current]", -1)}): "voltage",
-            frozenset({("[mass]", 1), ("[length]", 2), ("[time]", -3), ("[current]", -2)}): "resistance",
-        }
-
-        dims_set = frozenset((k, v) for k, v in normalized.items())
-        return quantity_map.get(dims_set)
+        if any(k not in _DIM_KEYS for k in dims):
+            # Normalize keys to [dimension] format
+            dims = {(k if k.startswith("[") else f"[{k}]"): v for k, v in dims.items()}
+            if any(k not in _DIM_KEYS for k in dims):
+                return None
+        return _QUANTITY_NAMES.get(_pack_dims(dims))
 
     def validate_equation(
         self,
@@ -671,12 +1007,54 @@ class EquationUnitValidator:
         logger.debug("variables: %s", variables)
         logger.debug("target: %s", target)
 
+        key = self._validation_key(equation, variables, target)
+        if key is None:
+            return self._validate(equation, variables, target)
+        # Callers get their own copy; the cached result stays pristine
+        return copy.deepcopy(self._validate_cached(key))
+
+    @staticmethod
+    def _validation_key(
+        equation: str,
+        variables: Dict[str, Dict[str, Any]],
+        target: Optional[str]
+    ) -> Optional[tuple]:
+        """
+        Hashable key for a validation, or None if an input can't be hashed.
+
+        Only "unit" and "value" are read from each variable, and variable order
+        decides substitution order, so both go in the key in order. The value's
+        type is included because 1 and 1.0 hash equal but render differently.
+        """
+        rows = tuple(
+            (name, info.get("unit"), type(value), value)
+            for name, info in variables.items()
+            for value in (info.get("value", 1),)
+        )
+        key = (equation, rows, target)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _validate_from_key(self, key: tuple) -> Dict[str, Any]:
+        equation, rows, target = key
+        variables = {name: {"unit": unit, "value": value} for name, unit, _, value in rows}
+        return self._validate(equation, variables, target)
+
+    def _validate(
+        self,
+        equation: str,
+        variables: Dict[str, Dict[str, Any]],
+        target: Optional[str]
+    ) -> Dict[str, Any]:
         errors = []
         warnings = []
         variable_analysis = {}
 
         # Parse equation sides
-        _lhs_str, rhs_str = parse_equation(equation)
+        lhs_str, rhs_str = parse_equation(equation)
         if rhs_str == "0" and "=" not in equation:
             return {
                 "valid": False,
@@ -700,7 +1078,7 @@ class EquationUnitValidator:
 
             try:
                 # Parse the unit
-                unit = self.ureg.parse_units(unit_str)
+                unit = self.registry._parse_units_cached(unit_str)
                 dims = self._dims_to_dict(unit.dimensionality)
                 quantity = self._get_common_quantity_name(dims)
 
@@ -740,7 +1118,7 @@ class EquationUnitValidator:
         if target and len([v for v in variables if v != target and variables[v].get("unit")]) >= 1:
             try:
                 target_expected_dims = self._infer_target_dimensions(
-                    equation, variables, target
+                    lhs_str, rhs_str, variables, target
                 )
                 if target_expected_dims:
                     expected_quantity = self._get_common_quantity_name(target_expected_dims)
@@ -755,7 +1133,7 @@ class EquationUnitValidator:
 
         # Check if equation LHS and RHS have compatible dimensions
         # by attempting to evaluate with unit quantities
-        dimensional_check = self._check_equation_balance(equation, variables)
+        dimensional_check = self._check_equation_balance(lhs_str, rhs_str, variables)
         if not dimensional_check["balanced"]:
             errors.append(dimensional_check["error"])
         elif dimensional_check.get("warning"):
@@ -785,7 +1163,8 @@ class EquationUnitValidator:
 
     def _infer_target_dimensions(
         self,
-        equation: str,
+        lhs: str,
+        rhs: str,
         variables: Dict[str, Dict[str, Any]],
         target: str
     ) -> Optional[Dict[str, int]]:
@@ -798,21 +1177,47 @@ class EquationUnitValidator:
         """
         # Simple algebraic inference for common patterns
         # This handles cases like "P = F/A" -> A = F/P
+        # lhs/rhs come from parse_equation in validate_equation
 
-        lhs, rhs = parse_equation(equation)
-
-        # Collect dimensions for known variables
-        known_dims = {}
+        # The answer depends only on each known variable's dimensions, not on
+        # values or the exact unit, so memoize on that signature. Unparseable
+        # units stay in as strings (they can still feed the LHS quantity).
+        signature = []
         for var_name, var_info in variables.items():
             if var_name == target:
                 continue
             unit_str = var_info.get("unit")
             if unit_str:
                 try:
-                    unit = self.ureg.parse_units(unit_str)
-                    known_dims[var_name] = dict(unit.dimensionality)
+                    unit = self.registry._parse_units_cached(unit_str)
+                    signature.append((var_name, unit.dimensionality, None))
                 except (pint.UndefinedUnitError, ValueError, TypeError) as e:
                     logger.debug("Failed to parse unit '%s' for variable '%s': %s", unit_str, var_name, e)
+                    signature.append((var_name, None, unit_str))
+
+        try:
+            result = self._infer_cached(lhs, rhs, target, tuple(signature))
+        except TypeError:
+            # Unhashable unit in the signature; infer without the memo
+            result = self._infer_from_signature(lhs, rhs, target, tuple(signature))
+        return dict(result) if result is not None else None
+
+    def _infer_from_signature(
+        self,
+        lhs: str,
+        rhs: str,
+        target: str,
+        signature: Tuple[tuple, ...]
+    ) -> Optional[Dict[str, int]]:
+        """_infer_target_dimensions body, from (name, dimensionality, unparsed unit) rows."""
+        # Collect dimensions for known variables
+        known_dims = {}
+        unparsed_units = {}
+        for var_name, dimensionality, unit_str in signature:
+            if dimensionality is not None:
+                known_dims[var_name] = dict(dimensionality)
+            else:
+                unparsed_units[var_name] = unit_str
 
         if not known_dims:
             return None
@@ -834,9 +1239,9 @@ class EquationUnitValidator:
             # Also handle LHS if it's not the target
             if lhs != target and lhs in known_dims:
                 unit_str = self._dims_to_unit_str(known_dims[lhs])
-                lhs_qty = self.ureg.parse_expression(f"1 * {unit_str}") if unit_str else None
-            elif lhs != target and lhs in variables and variables[lhs].get("unit"):
-                lhs_qty = self.ureg.parse_expression(f"1 * {variables[lhs]['unit']}")
+                lhs_qty = self.registry._parse_expression_cached(f"1 * {unit_str}") if unit_str else None
+            elif lhs != target and lhs in unparsed_units:
+                lhs_qty = self.registry._parse_expression_cached(f"1 * {unparsed_units[lhs]}")
             else:
                 lhs_qty = None
 
@@ -847,7 +1252,7 @@ class EquationUnitValidator:
                 return None
 
             # Evaluate RHS to get expected dimensions
-            rhs_qty = self.ureg.parse_expression(test_expr)
+            rhs_qty = self.registry._parse_expression_cached(test_expr)
 
             if lhs == target:
                 # Target is on LHS, so it should have RHS dimensions
@@ -868,20 +1273,10 @@ class EquationUnitValidator:
         if not dims:
             return "dimensionless"
 
-        dim_to_unit = {
-            "[mass]": "kg",
-            "[length]": "m",
-            "[time]": "s",
-            "[temperature]": "K",
-            "[current]": "A",
-            "[substance]": "mol",
-            "[luminosity]": "cd"
-        }
-
         parts = []
         for dim, power in dims.items():
             dim_key = dim if dim.startswith("[") else f"[{dim}]"
-            unit = dim_to_unit.get(dim_key)
+            unit = _DIM_TO_UNIT.get(dim_key)
             if unit:
                 if power == 1:
                     parts.append(unit)
@@ -892,71 +1287,60 @@ class EquationUnitValidator:
 
     def _check_equation_balance(
         self,
-        equation: str,
+        lhs_str: str,
+        rhs_str: str,
         variables: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Any]:
         """
         Check if equation LHS and RHS have compatible dimensions.
 
-        Uses Pint to evaluate both sides with unit quantities.
+        Uses Pint to evaluate both sides with unit quantities. Takes the
+        sides already split by parse_equation.
         """
-        lhs_str, rhs_str = parse_equation(equation)
 
-        # Build expressions with units
-        lhs_expr = lhs_str
-        rhs_expr = rhs_str
+        # Variables with units become "(value * unit)" quantities
+        replacements = {
+            name: f"({info.get('value', 1)} * {info['unit']})"
+            for name, info in variables.items() if info.get("unit")
+        }
 
-        # Count how many variables we can substitute
-        substituted = 0
-        for var_name, var_info in variables.items():
-            value = var_info.get("value", 1)
-            unit = var_info.get("unit")
+        # Neutralize unsubstituted variable names so Pint doesn't
+        # interpret them as unit names (e.g. 'A' → Ampere, 'C' → Coulomb).
+        # Both rewrites happen in one pass over the ORIGINAL text, so unit
+        # names inside a replacement are never mistaken for variables.
+        pattern = _substitution_pattern(tuple(replacements))
 
-            if unit:
-                replacement = f"({value} * {unit})"
-                if var_name in lhs_expr:
-                    lhs_expr = re.sub(rf'\b{re.escape(var_name)}\b', replacement, lhs_expr)
-                    substituted += 1
-                if var_name in rhs_expr:
-                    rhs_expr = re.sub(rf'\b{re.escape(var_name)}\b', replacement, rhs_expr)
-                    substituted += 1
+        def _rewrite(text: str) -> Tuple[str, bool, bool]:
+            """(rewritten text, substituted any variable, replaced any unknown)"""
+            found = [False, False]
+
+            def _replace(match) -> str:
+                name, token = match.group(1), match.group(2)
+                if name:
+                    found[0] = True
+                    return replacements[name]
+                if token in _MATH_BUILTINS:
+                    return token
+                found[1] = True
+                return '1'
+
+            return pattern.sub(_replace, text), found[0], found[1]
+
+        lhs_expr, lhs_substituted, lhs_has_unknowns = _rewrite(lhs_str)
+        rhs_expr, rhs_substituted, rhs_has_unknowns = _rewrite(rhs_str)
 
         # If we couldn't substitute any variables, we can't check
-        if substituted == 0:
+        if not (lhs_substituted or rhs_substituted):
             return {"balanced": True, "warning": "No units to validate"}
 
-        # Neutralize unsubstituted variable names so Pint doesn't
-        # interpret them as unit names (e.g. 'A' → Ampere, 'C' → Coulomb).
-        # Collect all variable-like tokens from the ORIGINAL equation,
-        # then determine which were NOT substituted (no unit info).
-        _MATH_BUILTINS = {
-            'pi', 'e', 'sin', 'cos', 'tan', 'asin', 'acos', 'atan',
-            'sqrt', 'log', 'ln', 'exp', 'abs', 'Abs',
-        }
-        var_pattern = re.compile(r'\b([A-Za-z_]\w*)\b')
-        original_tokens = set(var_pattern.findall(lhs_str + " " + rhs_str)) - _MATH_BUILTINS
-        substituted_vars = {name for name, info in variables.items() if info.get("unit")}
-        unsubstituted_vars = original_tokens - substituted_vars
-
-        # Replace unsubstituted variables with dimensionless 1
-        lhs_has_unknowns = False
-        rhs_has_unknowns = False
-        for uv in unsubstituted_vars:
-            if re.search(rf'\b{re.escape(uv)}\b', lhs_expr):
-                lhs_expr = re.sub(rf'\b{re.escape(uv)}\b', '1', lhs_expr)
-                lhs_has_unknowns = True
-            if re.search(rf'\b{re.escape(uv)}\b', rhs_expr):
-                rhs_expr = re.sub(rf'\b{re.escape(uv)}\b', '1', rhs_expr)
-                rhs_has_unknowns = True
-
         # If both sides have unknowns, we can't meaningfully check
         if lhs_has_unknowns and rhs_has_unknowns:
             return {"balanced": True, "warning": "Cannot validate: unsubstituted variables on both sides"}
 
         try:
             # Try to evaluate both sides
-            lhs_qty = self.ureg.parse_expression(lhs_expr)
-            rhs_qty = self.ureg.parse_expression(rhs_expr)
+            lhs_qty = self.registry._parse_expression_cached(lhs_expr)
+            rhs_qty = self.registry._parse_expression_cached(rhs_expr)
 
             def _get_dims(qty):
                 """Extract dimensionality dict, treating plain numbers as dimensionless."""
@@ -993,9 +1377,8 @@ class EquationUnitValidator:
                     "rhs_dims": rhs_dims
                 }
 
-        except Exception as e:
+        except _PARSE_ERRORS as e:
             # Parse errors often indicate variables without units - that's ok
-            error_str = str(e)
-            if "undefined" in error_str.lower() or "symbol" in error_str.lower():
+            if isinstance(e, pint.UndefinedUnitError):
                 return {"balanced": True, "warning": f"Could not fully validate: {e}"}
             return {"balanced": True, "warning": f"Validation incomplete: {e}"}